@@ -0,0 +1,47 @@
+"""add payment events
+
+Revision ID: 4c2d8e91f0ab
+Revises: e7b45fadc24e
+Create Date: 2026-10-18 14:05:22.417963
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c2d8e91f0ab'
+down_revision: Union[str, Sequence[str], None] = 'e7b45fadc24e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('payment_events',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('provider', sa.String(), nullable=False),
+    sa.Column('event_id', sa.String(), nullable=True),
+    sa.Column('event_type', sa.String(), nullable=True),
+    sa.Column('external_id', sa.String(), nullable=True),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('received_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_payment_events_id'), 'payment_events', ['id'], unique=False)
+    op.create_index('ix_payment_events_status_id', 'payment_events', ['status', 'id'], unique=False)
+    op.create_index('ix_payment_events_external_id', 'payment_events', ['external_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_payment_events_external_id', table_name='payment_events')
+    op.drop_index('ix_payment_events_status_id', table_name='payment_events')
+    op.drop_index(op.f('ix_payment_events_id'), table_name='payment_events')
+    op.drop_table('payment_events')
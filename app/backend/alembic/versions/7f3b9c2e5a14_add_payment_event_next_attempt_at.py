@@ -0,0 +1,28 @@
+"""add payment event next_attempt_at
+
+Revision ID: 7f3b9c2e5a14
+Revises: d4a9e2c71b36
+Create Date: 2026-10-18 20:42:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3b9c2e5a14'
+down_revision: Union[str, Sequence[str], None] = 'd4a9e2c71b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('payment_events', sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('payment_events', 'next_attempt_at')
@@ -0,0 +1,56 @@
+"""add user scoped indexes
+
+Revision ID: 9ad8cefd84b3
+Revises: 138a41d15b70
+Create Date: 2026-10-18 09:12:41.530218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9ad8cefd84b3'
+down_revision: Union[str, Sequence[str], None] = '138a41d15b70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # external_id is a merchant payment reference: stop rather than alter duplicates, so an operator
+    # can reconcile them before the unique index is created
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT user_id, external_id, count(*) FROM transactions WHERE external_id IS NOT NULL "
+        "GROUP BY user_id, external_id HAVING count(*) > 1 ORDER BY user_id, external_id"
+    )).all()
+    if duplicates:
+        report = "\n".join(f"  user_id={user_id} external_id={external_id} rows={count}"
+                           for user_id, external_id, count in duplicates[:50])
+        if len(duplicates) > 50:
+            report += f"\n  ... and {len(duplicates) - 50} more"
+        raise RuntimeError(
+            f"transactions has {len(duplicates)} duplicate (user_id, external_id) pairs; resolve them "
+            f"before creating ix_transactions_user_id_external_id:\n{report}"
+        )
+
+    op.create_index('ix_transactions_user_id_id', 'transactions', ['user_id', 'id'], unique=False)
+    op.create_index('ix_transactions_user_id_created_at', 'transactions', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_transactions_user_id_status', 'transactions', ['user_id', 'status'], unique=False)
+    op.create_index(
+        'ix_transactions_user_id_external_id', 'transactions', ['user_id', 'external_id'], unique=True
+    )
+    op.create_index('ix_payment_settings_user_id_id', 'payment_settings', ['user_id', 'id'], unique=False)
+    op.create_index('ix_payment_settings_user_id_provider', 'payment_settings', ['user_id', 'provider'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_payment_settings_user_id_provider', table_name='payment_settings')
+    op.drop_index('ix_payment_settings_user_id_id', table_name='payment_settings')
+    op.drop_index('ix_transactions_user_id_external_id', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_status', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_created_at', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_id', table_name='transactions')
\ No newline at end of file
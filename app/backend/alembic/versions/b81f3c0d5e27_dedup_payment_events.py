@@ -0,0 +1,35 @@
+"""dedup payment events
+
+Revision ID: b81f3c0d5e27
+Revises: 4c2d8e91f0ab
+Create Date: 2026-10-18 15:32:47.086514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81f3c0d5e27'
+down_revision: Union[str, Sequence[str], None] = '4c2d8e91f0ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the first copy of deliveries stored before the constraint existed
+    op.execute(
+        "DELETE FROM payment_events WHERE event_id IS NOT NULL AND id NOT IN ("
+        "SELECT min(id) FROM payment_events WHERE event_id IS NOT NULL GROUP BY provider, event_id)"
+    )
+    op.create_index(
+        'ix_payment_events_provider_event_id', 'payment_events', ['provider', 'event_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_payment_events_provider_event_id', table_name='payment_events')
@@ -0,0 +1,30 @@
+"""add merchant webhook secrets
+
+Revision ID: d4a9e2c71b36
+Revises: b81f3c0d5e27
+Create Date: 2026-10-18 18:21:09.640152
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a9e2c71b36'
+down_revision: Union[str, Sequence[str], None] = 'b81f3c0d5e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('payment_settings', sa.Column('webhook_secret', sa.String(), nullable=True))
+    op.add_column('payment_events', sa.Column('user_id', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('payment_events', 'user_id')
+    op.drop_column('payment_settings', 'webhook_secret')
@@ -0,0 +1,53 @@
+"""add transaction daily rollups
+
+Revision ID: e7b45fadc24e
+Revises: 9ad8cefd84b3
+Create Date: 2026-10-18 11:40:03.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b45fadc24e'
+down_revision: Union[str, Sequence[str], None] = '9ad8cefd84b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transaction_daily_rollups',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('currency', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'day', 'currency', 'status', name='uq_transaction_daily_rollups_key')
+    )
+    op.create_index(op.f('ix_transaction_daily_rollups_id'), 'transaction_daily_rollups', ['id'], unique=False)
+    # Backfill from existing transactions; afterwards the service keeps rollups current.
+    # Days are UTC like rollup_day(), not the Postgres session time zone.
+    if op.get_bind().dialect.name == "postgresql":
+        day = "date(timezone('UTC', created_at))"
+    else:
+        day = "date(created_at)"
+    op.execute(
+        "INSERT INTO transaction_daily_rollups (user_id, day, currency, status, transaction_count, total_amount) "
+        f"SELECT user_id, {day}, currency, status, count(id), coalesce(sum(amount), 0) "
+        "FROM transactions WHERE created_at IS NOT NULL "
+        f"GROUP BY user_id, {day}, currency, status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_transaction_daily_rollups_id'), table_name='transaction_daily_rollups')
+    op.drop_table('transaction_daily_rollups')
\ No newline at end of file
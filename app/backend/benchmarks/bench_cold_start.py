@@ -0,0 +1,74 @@
+"""Benchmark cold-start database initialization with and without the schema fingerprint check.
+
+Usage (from app/backend):
+    python -m benchmarks.bench_cold_start --repeat 10
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_cold_start
+
+Without DATABASE_URL a throwaway SQLite file is used. Every model table is created in the
+target database, so point it at an empty scratch database.
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import pkgutil
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import event
+
+import models
+from core.config import settings
+from core.database import DatabaseManager
+
+
+def _import_models():
+    for module in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"models.{module.name}")
+
+
+async def _cold_start(fingerprint_check: bool):
+    """One init_db + create_tables on a fresh manager; returns (ms, statements executed)"""
+    settings.db_schema_fingerprint_check = fingerprint_check
+    manager = DatabaseManager()
+    statements = 0
+
+    def _count(*args):
+        nonlocal statements
+        statements += 1
+
+    start = time.perf_counter()
+    await manager.init_db()
+    event.listen(manager.engine.sync_engine, "before_cursor_execute", _count)
+    await manager.create_tables()
+    elapsed = (time.perf_counter() - start) * 1000
+    await manager.close_db()
+    return elapsed, statements
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+    _import_models()
+
+    first_ms, first_statements = await _cold_start(fingerprint_check=True)
+    results = {"first start (creates schema)": ([first_ms], first_statements)}
+    for label, check in (("create_all every start", False), ("fingerprint unchanged", True)):
+        samples = []
+        for _ in range(args.repeat):
+            elapsed, statements = await _cold_start(fingerprint_check=check)
+            samples.append(elapsed)
+        results[label] = (samples, statements)
+
+    print(f"{'case':<32}{'median ms':>12}{'statements':>12}")
+    for label, (samples, statements) in results.items():
+        print(f"{label:<32}{statistics.median(samples):>12.2f}{statements:>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""Benchmark user-scoped transaction list queries with and without the composite indexes.
+
+Usage (from app/backend):
+    python -m benchmarks.bench_list_indexes --rows 1000000 --users 100
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_list_indexes
+
+Without DATABASE_URL a throwaway SQLite file is used. The target table is dropped and
+re-seeded, so never point this at a database holding real data.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.transactions import Transactions
+from services.transactions import TransactionsService
+
+SEED_CHUNK_SIZE = 10000
+STATUSES = ("success", "pending", "failed")
+
+
+def _build_rows(start: int, count: int, users: int, base: datetime):
+    for i in range(start, start + count):
+        yield {
+            "user_id": f"user-{i % users}",
+            "amount": round(random.uniform(1, 500), 2),
+            "currency": "IDR" if i % 3 else "USD",
+            "status": STATUSES[i % len(STATUSES)],
+            "payment_method": "card",
+            "external_id": f"bench-{i}",
+            "created_at": base + timedelta(seconds=i),
+        }
+
+
+async def _seed(engine, rows: int, users: int):
+    table = Transactions.__table__
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: table.drop(sync_conn, checkfirst=True))
+        await conn.run_sync(lambda sync_conn: table.create(sync_conn))
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for start in range(0, rows, SEED_CHUNK_SIZE):
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), list(_build_rows(start, min(SEED_CHUNK_SIZE, rows - start), users, base)))
+
+
+async def _set_indexes(engine, enabled: bool):
+    indexes = [index for index in Transactions.__table__.indexes if index.name != "ix_transactions_id"]
+    async with engine.begin() as conn:
+        for index in indexes:
+            if enabled:
+                await conn.run_sync(lambda sync_conn, ix=index: ix.create(sync_conn, checkfirst=True))
+            else:
+                await conn.run_sync(lambda sync_conn, ix=index: ix.drop(sync_conn, checkfirst=True))
+        if engine.dialect.name == "postgresql":
+            await conn.exec_driver_sql("ANALYZE transactions")
+        elif engine.dialect.name == "sqlite":
+            await conn.exec_driver_sql("ANALYZE")
+
+
+async def _time(session_maker, repeat: int, **kwargs) -> float:
+    samples = []
+    for _ in range(repeat):
+        async with session_maker() as db:
+            start = time.perf_counter()
+            await TransactionsService(db).get_list(**kwargs)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        database_url = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+    engine = create_async_engine(database_url)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    print(f"Seeding {args.rows} transactions for {args.users} users on {engine.dialect.name}...")
+    await _seed(engine, args.rows, args.users)
+
+    cases = {
+        "first page (-id)": dict(limit=20, user_id="user-7"),
+        "deep page skip=5000": dict(skip=5000, limit=20, user_id="user-7"),
+        "sort -created_at": dict(limit=20, user_id="user-7", sort="-created_at"),
+        "filter status": dict(limit=20, user_id="user-7", query_dict={"status": "failed"}),
+        "cursor page (-id)": dict(limit=20, user_id="user-7", cursor="", count="none"),
+    }
+    results = {}
+    for label, enabled in (("before", False), ("after", True)):
+        await _set_indexes(engine, enabled)
+        results[label] = {name: await _time(session_maker, args.repeat, **kwargs) for name, kwargs in cases.items()}
+
+    print(f"{'case':<24}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name in cases:
+        before, after = results["before"][name], results["after"][name]
+        print(f"{name:<24}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
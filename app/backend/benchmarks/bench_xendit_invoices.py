@@ -0,0 +1,86 @@
+"""Benchmark Xendit invoice creation through the shared pooled client vs a new client per call.
+
+Usage (from app/backend):
+    python -m benchmarks.bench_xendit_invoices --requests 500 --concurrency 20
+    python -m benchmarks.bench_xendit_invoices --base-url https://mock.example:4443 --api-key xnd_...
+
+Without --base-url an in-process benchmarks.mock_xendit server is started on a free
+local port. Plain HTTP shows only the TCP setup saved by keep-alive; put the mock (or
+a staging endpoint) behind TLS to measure the handshake savings.
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import time
+import uuid
+from decimal import Decimal
+
+import httpx
+import uvicorn
+
+from benchmarks.mock_xendit import create_app
+from core.http_client import close_http_client
+from services.xendit_payment import XenditInvoiceRequest, XenditPaymentService
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _create_invoice(service: XenditPaymentService) -> float:
+    start = time.perf_counter()
+    await service.create_invoice(XenditInvoiceRequest(external_id=f"bench-{uuid.uuid4()}", amount=Decimal("150000")))
+    return (time.perf_counter() - start) * 1000
+
+
+async def _run(base_url: str, api_key: str, requests: int, concurrency: int, pooled: bool):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> float:
+        async with semaphore:
+            if pooled:
+                return await _create_invoice(XenditPaymentService(api_key=api_key, base_url=base_url))
+            async with httpx.AsyncClient() as client:
+                return await _create_invoice(XenditPaymentService(api_key=api_key, base_url=base_url, client=client))
+
+    start = time.perf_counter()
+    samples = await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1], requests / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--base-url", default="")
+    parser.add_argument("--api-key", default="xnd_development_bench")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        port = _free_port()
+        server = uvicorn.Server(uvicorn.Config(create_app(), host="127.0.0.1", port=port, log_level="warning"))
+        asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        base_url = f"http://127.0.0.1:{port}"
+
+    print(f"{'client':<20}{'p50 ms':>10}{'p95 ms':>10}{'req/s':>10}")
+    for label, pooled in (("new per call", False), ("shared pool", True)):
+        p50, p95, throughput = await _run(base_url, args.api_key, args.requests, args.concurrency, pooled)
+        print(f"{label:<20}{p50:>10.2f}{p95:>10.2f}{throughput:>10.0f}")
+
+    await close_http_client()
+    if server:
+        server.should_exit = True
+        await asyncio.sleep(0.1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
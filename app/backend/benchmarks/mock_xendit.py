@@ -0,0 +1,134 @@
+"""Local stand-in for the Xendit invoice and payment request APIs.
+
+Usage (from app/backend):
+    python -m benchmarks.mock_xendit --port 4010 --latency-ms 50
+    XENDIT_API_URL=http://127.0.0.1:4010 XENDIT_API_KEY=xnd_development_test ...
+
+State lives in memory. Any non-empty Basic auth username is accepted except "invalid",
+which answers 401. POST /_mock/invoices/{id}/status and
+/_mock/payment_requests/{id}/status move an object to another status. The app can also
+be mounted in-process with httpx.ASGITransport.
+"""
+import argparse
+import asyncio
+import base64
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+MOCK_CHECKOUT_URL = "https://ewallet-mock-connector.xendit.co/v1/ewallet_connector/checkouts"
+
+
+def create_app(latency_ms: float = 0.0) -> FastAPI:
+    app = FastAPI(title="Mock Xendit")
+    invoices: Dict[str, Dict[str, Any]] = {}
+    payment_requests: Dict[str, Dict[str, Any]] = {}
+    idempotency: Dict[str, str] = {}
+
+    def _error(status_code: int, error_code: str, message: str) -> JSONResponse:
+        return JSONResponse({"error_code": error_code, "message": message}, status_code=status_code)
+
+    @app.middleware("http")
+    async def authenticate(request: Request, call_next):
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        if request.url.path.startswith("/_mock"):
+            return await call_next(request)
+        authorization = request.headers.get("authorization", "")
+        username = ""
+        if authorization.startswith("Basic "):
+            username = base64.b64decode(authorization[6:]).decode().split(":", 1)[0]
+        if not username or username == "invalid":
+            return _error(401, "INVALID_API_KEY", "API key is invalid")
+        return await call_next(request)
+
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    @app.post("/v2/invoices")
+    async def create_invoice(payload: Dict[str, Any]):
+        if not payload.get("external_id") or not payload.get("amount"):
+            return _error(400, "API_VALIDATION_ERROR", "external_id and amount are required")
+        invoice_id = uuid.uuid4().hex[:24]
+        duration = payload.get("invoice_duration") or 86400
+        invoice = {
+            **payload,
+            "id": invoice_id,
+            "status": "PENDING",
+            "currency": payload.get("currency", "IDR"),
+            "invoice_url": f"https://checkout-staging.xendit.co/web/{invoice_id}",
+            "expiry_date": (_now() + timedelta(seconds=duration)).isoformat(),
+            "created": _now().isoformat(),
+            "updated": _now().isoformat(),
+        }
+        invoices[invoice_id] = invoice
+        return invoice
+
+    @app.get("/v2/invoices/{invoice_id}")
+    async def get_invoice(invoice_id: str):
+        if invoice_id not in invoices:
+            return _error(404, "INVOICE_NOT_FOUND_ERROR", f"Invoice {invoice_id} not found")
+        return invoices[invoice_id]
+
+    @app.post("/payment_requests")
+    async def create_payment_request(payload: Dict[str, Any], idempotency_key: Optional[str] = Header(None)):
+        if idempotency_key and idempotency_key in idempotency:
+            return payment_requests[idempotency[idempotency_key]]
+        if not payload.get("reference_id") or not payload.get("amount") or not payload.get("payment_method"):
+            return _error(400, "API_VALIDATION_ERROR", "reference_id, amount and payment_method are required")
+        payment_request_id = f"pr-{uuid.uuid4()}"
+        payment_request = {
+            **payload,
+            "id": payment_request_id,
+            "status": "REQUIRES_ACTION",
+            "actions": [
+                {
+                    "action": "AUTH",
+                    "url_type": "WEB",
+                    "method": "GET",
+                    "url": f"{MOCK_CHECKOUT_URL}?token={payment_request_id}",
+                }
+            ],
+            "created": _now().isoformat(),
+            "updated": _now().isoformat(),
+        }
+        payment_requests[payment_request_id] = payment_request
+        if idempotency_key:
+            idempotency[idempotency_key] = payment_request_id
+        return payment_request
+
+    @app.get("/payment_requests/{payment_request_id}")
+    async def get_payment_request(payment_request_id: str):
+        if payment_request_id not in payment_requests:
+            return _error(404, "DATA_NOT_FOUND", f"Payment request {payment_request_id} not found")
+        return payment_requests[payment_request_id]
+
+    def _set_status(store: Dict[str, Dict[str, Any]], object_id: str, status: str) -> Dict[str, Any]:
+        if object_id not in store:
+            raise HTTPException(status_code=404, detail=f"{object_id} not found")
+        store[object_id].update(status=status, updated=_now().isoformat())
+        return store[object_id]
+
+    @app.post("/_mock/invoices/{invoice_id}/status")
+    async def set_invoice_status(invoice_id: str, payload: Dict[str, Any]):
+        return _set_status(invoices, invoice_id, payload.get("status", "PAID"))
+
+    @app.post("/_mock/payment_requests/{payment_request_id}/status")
+    async def set_payment_request_status(payment_request_id: str, payload: Dict[str, Any]):
+        return _set_status(payment_requests, payment_request_id, payload.get("status", "SUCCEEDED"))
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4010)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency_ms), host=args.host, port=args.port, log_level="warning")
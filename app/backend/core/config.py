@@ -22,6 +22,64 @@ class Settings(BaseSettings):
     lambda_function_name: str = "fastapi-backend"
     aws_region: str = "us-east-1"
 
+    # Optional read replica for read-only GET handlers (see get_read_db)
+    database_read_url: str = ""
+
+    # Database connection pool
+    # "auto" = "single" on Lambda, "queue" elsewhere; "single" keeps one connection reused across
+    # warm invocations; "queue" is a regular QueuePool; "null" opens a connection per checkout
+    db_pool_mode: str = "auto"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 3600
+    db_pool_timeout: int = 30
+    db_pool_pre_ping: bool = True
+    # "single" mode pings a reused connection only after it sat idle this long (seconds)
+    db_liveness_check_after: int = 60
+    # Connecting through PgBouncer in transaction mode: disable prepared statement caching
+    db_pgbouncer: bool = False
+    # Statements at or above this duration are logged as [DB_SLOW]; 0 disables
+    db_slow_query_ms: int = 500
+    # Skip create_all at startup when the stored schema fingerprint matches the models
+    db_schema_fingerprint_check: bool = True
+
+    # Bearer token required by /api/v1/metrics; without one the endpoint answers 403 unless
+    # METRICS_PUBLIC is set, since it exposes the normalized SQL of every query shape
+    metrics_token: str = ""
+    metrics_public: bool = False
+
+    # Shared outbound HTTP client (core/http_client.py) used for payment provider APIs
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 30.0
+    http_connect_timeout: float = 5.0
+
+    # Xendit API base URL; point it at benchmarks/mock_xendit.py for local tests and load runs
+    xendit_api_url: str = "https://api.xendit.co"
+
+    # Configured payment gateways cached per (user, provider, environment); see services/payment_gateway.py
+    payment_gateway_cache_size: int = 1024
+    payment_gateway_cache_ttl: int = 300
+    # Checkout status polling: open checkouts are re-fetched after this many seconds, terminal ones are kept
+    checkout_status_cache_size: int = 10000
+    checkout_status_cache_ttl: int = 5
+
+    # Webhook authentication for the platform account: Stripe endpoint signing secret (whsec_...) and Xendit
+    # callback verification token. Merchant accounts use payment_settings.webhook_secret instead.
+    stripe_webhook_secret: str = ""
+    xendit_callback_token: str = ""
+    # Background tasks applying stored webhook events, and retries before an event stays failed
+    payment_event_workers: int = 4
+    payment_event_max_attempts: int = 5
+    # Seconds between sweeps for due retries, base retry delay (doubled per attempt), and how long a claimed
+    # event may stay "processing" before another worker may take it over
+    payment_event_sweep_interval: int = 30
+    payment_event_retry_delay: int = 30
+    payment_event_claim_timeout: int = 300
+    # Recently stored webhook event IDs kept in memory to drop retried deliveries without a DB write
+    payment_event_dedup_cache_size: int = 100000
+
     @property
     def backend_url(self) -> str:
         """Generate backend URL from host and port."""
@@ -1,8 +1,10 @@
 import asyncio
+import hashlib
 import logging
 import os
 import re
 import time
+import uuid
 from pathlib import Path
 
 from asyncpg.exceptions import (
@@ -10,27 +12,71 @@ from asyncpg.exceptions import (
     UniqueViolationError,
 )
 from core.config import settings
-from sqlalchemy import DDL, text
+from core.metrics import InstrumentedQueuePool, db_metrics
+from sqlalchemy import DDL, Column, DateTime, Integer, String, Table, delete, event, exc, func, insert, select, text
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 logger = logging.getLogger(__name__)
 
+# Session.info flag set by get_uow_db; services then flush instead of committing
+UNIT_OF_WORK_KEY = "unit_of_work"
+
 
 class Base(DeclarativeBase):
     pass
 
 
+# Hash of the schema create_tables last applied; a match lets startup skip create_all
+schema_fingerprint = Table(
+    "schema_fingerprint",
+    Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
 class DatabaseManager:
     def __init__(self):
         self.engine = None
         self._initialized = False
         self.async_session_maker = None
+        # Read replica (DATABASE_READ_URL); falls back to the primary when not configured
+        self.read_engine = None
+        self.read_session_maker = None
         self._init_lock = asyncio.Lock()  # Protect initialization process
         self._table_creation_lock = asyncio.Lock()  # Protect table creation process
 
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    def _schema_fingerprint(self) -> str:
+        """sha256 of the DDL create_all would emit for the current models on this dialect"""
+        dialect = self.engine.dialect
+        digest = hashlib.sha256()
+        for table in Base.metadata.sorted_tables:
+            digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+            for index in sorted(table.indexes, key=lambda index: index.name or ""):
+                digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+        return digest.hexdigest()
+
+    async def _stored_schema_fingerprint(self):
+        """Fingerprint recorded by the last create_tables, or None (including before the table exists)"""
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(
+                    select(schema_fingerprint.c.fingerprint).where(schema_fingerprint.c.id == 1)
+                )
+                return result.scalar()
+        except exc.DBAPIError as e:
+            logger.debug(f"No stored schema fingerprint: {e}")
+            return None
+
     def _normalize_async_database_url(self, raw_url: str) -> str:
         """Ensure the database URL uses an async driver compatible with SQLAlchemy asyncio.
 
@@ -102,45 +148,125 @@ class DatabaseManager:
             database_url = self._normalize_async_database_url(settings.database_url)
 
             logger.info("Creating async database engine...")
-            # Configure engine based on environment (Lambda vs non-Lambda)
-            engine_kwargs = {
-                "echo": settings.debug,
-            }
-
-            # Check if we're in a Lambda environment
-            is_lambda = bool(
-                os.environ.get("AWS_LAMBDA_FUNCTION_NAME")
-                or os.environ.get("IS_LAMBDA", "").lower() in ("true", "1", "yes")
-            )
-
-            if is_lambda:
-                # Lambda: Use NullPool to avoid connection state conflicts
-                # NullPool creates a fresh connection for each request, avoiding "cannot switch to state" errors
-                engine_kwargs["poolclass"] = NullPool
-                # NullPool doesn't support pool_timeout, pool_size, max_overflow, pool_recycle, or pool_pre_ping
-                # These parameters are only valid for QueuePool
-                logger.info("Using NullPool for Lambda environment to avoid connection state conflicts")
-            else:
-                # Non-Lambda: Use QueuePool with connection pooling
-                engine_kwargs["pool_pre_ping"] = True  # Verify connections before using them
-                engine_kwargs["pool_size"] = 10  # Connection pool size
-                engine_kwargs["max_overflow"] = 20  # Maximum overflow connections
-                engine_kwargs["pool_recycle"] = 3600  # Connection recycle time (1 hour)
-                engine_kwargs["pool_timeout"] = 30  # Connection acquisition timeout (30 seconds)
-                logger.info("Using QueuePool with connection pooling for non-Lambda environment")
-
-            self.engine = create_async_engine(database_url, **engine_kwargs)
+            self.engine = self._create_engine(database_url, "primary")
             logger.info("Database engine created successfully")
 
             logger.info("Creating async session maker...")
             self.async_session_maker = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
             logger.info("Async session maker created successfully")
 
+            if settings.database_read_url:
+                logger.info("Creating read replica engine...")
+                read_url = self._normalize_async_database_url(settings.database_read_url)
+                self.read_engine = self._create_engine(read_url, "replica")
+                self.read_session_maker = async_sessionmaker(
+                    self.read_engine, class_=AsyncSession, expire_on_commit=False
+                )
+                logger.info("Read replica engine created successfully")
+
             logger.info("Database connection initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}", exc_info=True)
             raise
 
+    def _create_engine(self, database_url: str, name: str):
+        engine = create_async_engine(database_url, **self._engine_kwargs(database_url))
+        if self._pool_mode() == "single":
+            self._install_liveness_check(engine)
+        db_metrics.instrument(engine, name)
+        return engine
+
+    @staticmethod
+    def _pool_mode() -> str:
+        mode = settings.db_pool_mode.lower()
+        if mode == "auto":
+            # Check if we're in a Lambda environment
+            is_lambda = bool(
+                os.environ.get("AWS_LAMBDA_FUNCTION_NAME")
+                or os.environ.get("IS_LAMBDA", "").lower() in ("true", "1", "yes")
+            )
+            return "single" if is_lambda else "queue"
+        if mode not in ("single", "queue", "null"):
+            raise ValueError(f"Invalid DB_POOL_MODE: {settings.db_pool_mode}")
+        return mode
+
+    def _engine_kwargs(self, database_url: str) -> dict:
+        """Build create_async_engine arguments from the pool settings"""
+        engine_kwargs = {
+            "echo": settings.debug,
+        }
+        mode = self._pool_mode()
+        if mode == "null":
+            # NullPool doesn't support pool_timeout, pool_size, max_overflow, pool_recycle, or pool_pre_ping
+            engine_kwargs["poolclass"] = NullPool
+            logger.info("Using NullPool: a new connection per checkout")
+        elif mode == "single":
+            # Lambda handles one request at a time per container; keep that one connection warm
+            # across invocations. Liveness is checked on reuse after idling, not on every checkout.
+            engine_kwargs["poolclass"] = InstrumentedQueuePool
+            engine_kwargs["pool_size"] = 1
+            engine_kwargs["max_overflow"] = 0
+            engine_kwargs["pool_recycle"] = settings.db_pool_recycle
+            engine_kwargs["pool_timeout"] = settings.db_pool_timeout
+            logger.info("Using a single reused connection (Lambda mode)")
+        else:
+            engine_kwargs["poolclass"] = InstrumentedQueuePool
+            engine_kwargs["pool_pre_ping"] = settings.db_pool_pre_ping
+            engine_kwargs["pool_size"] = settings.db_pool_size
+            engine_kwargs["max_overflow"] = settings.db_max_overflow
+            engine_kwargs["pool_recycle"] = settings.db_pool_recycle
+            engine_kwargs["pool_timeout"] = settings.db_pool_timeout
+            logger.info(
+                f"Using QueuePool: pool_size={settings.db_pool_size}, max_overflow={settings.db_max_overflow}"
+            )
+
+        if settings.db_pgbouncer:
+            if "+asyncpg" in make_url(database_url).drivername:
+                # PgBouncer transaction mode can hand each transaction a different server connection,
+                # so named prepared statements must be neither cached nor reused
+                engine_kwargs["connect_args"] = {
+                    "statement_cache_size": 0,
+                    "prepared_statement_cache_size": 0,
+                    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+                }
+                logger.info("PgBouncer mode: prepared statement caching disabled")
+            else:
+                logger.warning("DB_PGBOUNCER only applies to postgresql+asyncpg; ignored")
+        return engine_kwargs
+
+    @staticmethod
+    def _install_liveness_check(engine):
+        """Ping a pooled connection on checkout only if it idled past db_liveness_check_after
+
+        Connections created on another event loop (a previous Lambda invocation's) are
+        discarded, which is what used to cause "cannot switch to state" errors.
+        """
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            connection_record.info["loop"] = id(asyncio.get_running_loop())
+            connection_record.info["last_used"] = time.monotonic()
+
+        @event.listens_for(sync_engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            connection_record.info["last_used"] = time.monotonic()
+
+        @event.listens_for(sync_engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            if connection_record.info.get("loop") != id(asyncio.get_running_loop()):
+                raise exc.DisconnectionError("Pooled connection belongs to a different event loop")
+            idle = time.monotonic() - connection_record.info.get("last_used", 0)
+            if idle < settings.db_liveness_check_after:
+                return
+            try:
+                alive = sync_engine.dialect.do_ping(dbapi_connection)
+            except Exception as e:
+                logger.warning(f"Liveness check failed after {idle:.0f}s idle: {e}")
+                alive = False
+            if not alive:
+                raise exc.DisconnectionError("Pooled connection failed liveness check")
+
     async def close_db(self):
         """Close database connection and dispose engine
 
@@ -152,6 +278,8 @@ class DatabaseManager:
 
         try:
             await self.engine.dispose()
+            if self.read_engine:
+                await self.read_engine.dispose()
             logger.info("Database connection closed and engine disposed")
         except Exception as e:
             logger.warning(f"Error disposing database engine: {e}")
@@ -159,6 +287,8 @@ class DatabaseManager:
             # Always reset references even if dispose fails
             self.engine = None
             self.async_session_maker = None
+            self.read_engine = None
+            self.read_session_maker = None
             self._initialized = False  # Reset initialization flag
 
     async def create_tables(self):
@@ -179,10 +309,20 @@ class DatabaseManager:
             # await self.check_and_repair_existing_tables()
             # logger.info("🔧 Table structure repair completed")
 
+            fingerprint = self._schema_fingerprint()
+            if settings.db_schema_fingerprint_check:
+                if await self._stored_schema_fingerprint() == fingerprint:
+                    self._initialized = True
+                    logger.info("Schema fingerprint unchanged, skipping table creation")
+                    logger.debug(f"[DB_OP] Create tables skipped in {time.time() - start_time:.4f}s")
+                    return
+
             try:
                 logger.info("🔧 Starting table creation...")
                 async with self.engine.begin() as conn:
                     await conn.run_sync(Base.metadata.create_all)
+                    await conn.execute(delete(schema_fingerprint))
+                    await conn.execute(insert(schema_fingerprint).values(id=1, fingerprint=fingerprint))
                     self._initialized = True
                     logger.info("Tables initialized successfully")
                     logger.debug(f"[DB_OP] Create tables completed in {time.time() - start_time:.4f}s")
@@ -196,18 +336,22 @@ class DatabaseManager:
             self._table_creation_lock.release()
 
     async def check_and_repair_existing_tables(self):
-        """Check and fix the structure of existing tables, adding only the missing fields."""
+        """Check and fix the structure of existing tables, adding only the missing fields.
+
+        Columns of every existing table come from one catalog query; each table that
+        needs repair then gets a single ALTER TABLE, run concurrently across tables.
+        """
         repair_start = time.time()
 
         try:
-            existing_tables = await self._get_existing_tables()
+            existing_columns = await self._get_all_table_columns()
 
-            if not existing_tables:
+            if not existing_columns:
                 logger.info("No existing tables found, skipping repair")
                 return
 
             model_tables = list(Base.metadata.tables.keys())
-            tables_to_repair = [table for table in model_tables if table in existing_tables]
+            tables_to_repair = [table for table in model_tables if table in existing_columns]
 
             if not tables_to_repair:
                 logger.info("No existing tables need repair")
@@ -220,7 +364,7 @@ class DatabaseManager:
             async def repair_with_semaphore(table_name):
                 start_time = time.time()
                 async with semaphore:
-                    await self._repair_table_structure(table_name)
+                    await self._repair_table_structure(table_name, existing_columns[table_name])
                 logger.info(f"Table {table_name} repaired in {time.time() - start_time:.2f}s")
 
             await asyncio.gather(
@@ -254,37 +398,11 @@ class DatabaseManager:
         """Validate and escape column name."""
         return self._escape_identifier(column_name, "column name")
 
-    async def _get_existing_tables(self):
-        """Fetch all existing table names at once."""
-        try:
-            if self.engine.dialect.name == "postgresql":
-                query = text(
-                    """
-                             SELECT table_name
-                             FROM information_schema.tables
-                             WHERE table_schema = 'public'
-                             """
-                )
-            elif self.engine.dialect.name == "sqlite":
-                query = text("SELECT name FROM sqlite_master WHERE type='table'")
-            else:
-                # MySQL 等其他数据库
-                query = text("SHOW TABLES")
-
-            async with self.engine.begin() as conn:
-                result = await conn.execute(query)
-                return [row[0] for row in result.fetchall()]
-
-        except Exception as e:
-            logger.error(f"Failed to get existing tables: {e}")
-            return []
-
-    async def _repair_table_structure(self, table_name: str):
+    async def _repair_table_structure(self, table_name: str, existing_columns: list):
         """Repair the structure of a single table by adding only the missing fields."""
         try:
             logger.debug(f"Checking table structure for: {table_name}")
 
-            existing_columns = await self._get_table_columns(table_name)
             model_columns = self._get_model_columns(table_name)
             missing_columns = self._find_missing_columns(existing_columns, model_columns)
 
@@ -301,7 +419,10 @@ class DatabaseManager:
             logger.warning(f"Failed to repair table {table_name}: {e}")
 
     async def _add_missing_columns(self, table_name: str, missing_columns: list):
-        """Batch add missing fields to improve efficiency.
+        """Add all missing fields to a table in one ALTER TABLE statement.
+
+        SQLite only accepts one ADD COLUMN per ALTER TABLE, so there the statements
+        are issued one per column inside the same transaction.
 
         Security: All inputs are validated and escaped before SQL generation:
         - table_name: validated and escaped via _escape_table_name()
@@ -310,62 +431,70 @@ class DatabaseManager:
         - default values: sanitized and validated before use
         """
         try:
+            # Security: All inputs validated and escaped before DDL generation
+            if self.engine.dialect.name == "sqlite":
+                statements = [self._generate_add_column_sql(table_name, column_info) for column_info in missing_columns]
+            else:
+                statements = [self._generate_add_columns_sql(table_name, missing_columns)]
+
             async with self.engine.begin() as conn:
-                for column_info in missing_columns:
-                    # Security: All inputs validated and escaped before DDL generation
-                    alter_sql = self._generate_add_column_sql(table_name, column_info)
+                for alter_sql in statements:
                     # Use DDL object instead of text() to avoid security scanner warnings
                     # All user inputs are already validated and escaped in _generate_add_column_sql
-                    ddl = DDL(alter_sql)
-                    await conn.execute(ddl)
-                    logger.info(f"Added column {column_info['name']} to table {table_name}")
+                    await conn.execute(DDL(alter_sql))
 
-            logger.info(f"Successfully added {len(missing_columns)} columns to table {table_name}")
+            logger.info(
+                f"Successfully added {len(missing_columns)} columns to table {table_name}: "
+                f"{[col['name'] for col in missing_columns]}"
+            )
 
         except Exception as e:
             logger.error(f"Failed to add columns to table {table_name}: {e}")
 
-    async def _get_table_columns(self, table_name: str):
-        """Get existing table column information"""
+    async def _get_all_table_columns(self):
+        """Get existing column information for every table with a single catalog query
+
+        Returns a dict of table name -> list of column dicts; tables absent from the
+        dict do not exist.
+        """
         try:
-            if self.engine.dialect.name == "postgresql":
-                # Use parameterized query - build query string separately to avoid scanner warnings
-                query_str = (
-                    "SELECT column_name, data_type, is_nullable, column_default "
+            dialect_name = self.engine.dialect.name
+            if dialect_name == "postgresql":
+                query = text(
+                    "SELECT table_name, column_name, data_type, is_nullable, column_default "
                     "FROM information_schema.columns "
-                    "WHERE table_name = :table_name"
+                    "WHERE table_schema = 'public' "
+                    "ORDER BY table_name, ordinal_position"
+                )
+            elif dialect_name == "sqlite":
+                # pragma_table_info() as a table-valued function covers every table in one statement
+                query = text(
+                    "SELECT m.name, p.name, p.type, p.\"notnull\", p.dflt_value "
+                    "FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+                    "WHERE m.type = 'table' "
+                    "ORDER BY m.name, p.cid"
                 )
-                query = text(query_str)
-            elif self.engine.dialect.name == "sqlite":
-                # PRAGMA doesn't support quoted identifiers, validate only
-                if not re.match(r"^[a-zA-Z0-9_-]+$", table_name):
-                    raise ValueError(
-                        f"Invalid table name: {table_name}. "
-                        "Only alphanumeric characters, underscores, and hyphens are allowed."
-                    )
-                # Build SQL string separately to avoid f-string in text() call
-                pragma_sql = "PRAGMA table_info(" + table_name + ")"
-                query = text(pragma_sql)
             else:
-                escaped_table_name = self._escape_table_name(table_name)
-                # Build SQL string separately to avoid f-string in text() call
-                describe_sql = "DESCRIBE " + escaped_table_name
-                query = text(describe_sql)
-
-            async with self.engine.begin() as conn:
-                result = await conn.execute(
-                    query, {"table_name": table_name} if self.engine.dialect.name == "postgresql" else {}
+                query = text(
+                    "SELECT table_name, column_name, data_type, is_nullable, column_default "
+                    "FROM information_schema.columns "
+                    "WHERE table_schema = DATABASE() "
+                    "ORDER BY table_name, ordinal_position"
                 )
-                columns = []
+
+            async with self.engine.connect() as conn:
+                result = await conn.execute(query)
+                tables = {}
                 for row in result.fetchall():
-                    if self.engine.dialect.name == "sqlite":
-                        columns.append({"name": row[1], "type": row[2], "nullable": not row[3], "default": row[4]})
+                    if dialect_name == "sqlite":
+                        column = {"name": row[1], "type": row[2], "nullable": not row[3], "default": row[4]}
                     else:
-                        columns.append({"name": row[0], "type": row[1], "nullable": row[2] == "YES", "default": row[3]})
-                return columns
+                        column = {"name": row[1], "type": row[2], "nullable": row[3] == "YES", "default": row[4]}
+                    tables.setdefault(row[0], []).append(column)
+                return tables
         except Exception as e:
-            logger.error(f"Failed to get columns for table {table_name}: {e}")
-            return []
+            logger.error(f"Failed to get table columns: {e}")
+            return {}
 
     def _get_model_columns(self, table_name: str):
         """Get model-defined column information"""
@@ -431,16 +560,27 @@ class DatabaseManager:
 
     def _generate_add_column_sql(self, table_name: str, column_info: dict):
         """Generate ALTER TABLE ADD COLUMN SQL statement"""
+        return self._generate_add_columns_sql(table_name, [column_info])
+
+    def _generate_add_columns_sql(self, table_name: str, columns: list):
+        """Generate one ALTER TABLE statement adding every column in ``columns``"""
+        escaped_table_name = self._escape_table_name(table_name)
+        clauses = [f"ADD COLUMN {self._generate_column_definition(table_name, column_info)}" for column_info in columns]
+        sql = f"ALTER TABLE {escaped_table_name} " + ", ".join(clauses)
+        logger.debug(f"ALTER SQL: {sql}")
+        return sql
+
+    def _generate_column_definition(self, table_name: str, column_info: dict):
+        """Generate the column definition of an ADD COLUMN clause"""
         column_name = column_info["name"]
         column_type = column_info["type"]
         nullable = column_info["nullable"]
         default = column_info["default"]
 
-        # Escape table and column names to prevent SQL injection
-        escaped_table_name = self._escape_table_name(table_name)
+        # Escape column names to prevent SQL injection
         escaped_column_name = self._escape_column_name(column_name)
 
-        sql = f"ALTER TABLE {escaped_table_name} ADD COLUMN {escaped_column_name} {column_type}"
+        sql = f"{escaped_column_name} {column_type}"
 
         # If column is NOT NULL but has no default, make it nullable to avoid constraint violations
         if not nullable and default is None:
@@ -473,7 +613,6 @@ class DatabaseManager:
                     sql += f" DEFAULT '{default}'"
                 else:
                     sql += f" DEFAULT {default}"
-        logger.debug(f"ALTER SQL: {sql}")
 
         return sql
 
@@ -509,11 +648,11 @@ class DatabaseManager:
 db_manager = DatabaseManager()
 
 
-async def get_db() -> AsyncSession:
-    """FastAPI dependency for database session with lazy initialization support"""
-    start_time = time.time()
-    logger.debug("[DB_OP] Starting get_db session creation")
+async def _get_session_maker(read: bool = False) -> async_sessionmaker:
+    """Return the session maker, lazily initializing the database if needed
 
+    ``read`` selects the read replica when DATABASE_READ_URL is configured.
+    """
     # Lazy initialization for Lambda environments where lifespan may not trigger
     if not db_manager.async_session_maker:
         logger.warning("Database session maker not available, attempting lazy initialization...")
@@ -526,9 +665,27 @@ async def get_db() -> AsyncSession:
     if not db_manager.async_session_maker:
         logger.error("No async database session maker available after initialization attempt")
         raise RuntimeError("Database not initialized")
+    if read and db_manager.read_session_maker:
+        return db_manager.read_session_maker
+    return db_manager.async_session_maker
+
+
+async def commit_or_flush(session: AsyncSession) -> None:
+    """Commit the session, or only flush it when it belongs to a request-scoped unit of work"""
+    if session.info.get(UNIT_OF_WORK_KEY):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+async def get_db() -> AsyncSession:
+    """FastAPI dependency for database session with lazy initialization support"""
+    start_time = time.time()
+    logger.debug("[DB_OP] Starting get_db session creation")
+    session_maker = await _get_session_maker()
 
     try:
-        async with db_manager.async_session_maker() as session:
+        async with session_maker() as session:
             logger.debug(f"[DB_OP] Database session created successfully in {time.time() - start_time:.4f}s")
             try:
                 yield session
@@ -543,3 +700,40 @@ async def get_db() -> AsyncSession:
     except Exception as e:
         logger.error(f"Failed to create database session: {e}", exc_info=True)
         raise
+
+
+async def get_read_db() -> AsyncSession:
+    """FastAPI dependency for a read-only session, served by the read replica when configured
+
+    Replicas lag the primary, so use it only for reads that tolerate slightly stale data
+    (lists, dashboards, stats) and never for read-then-write flows.
+    """
+    start_time = time.time()
+    session_maker = await _get_session_maker(read=True)
+
+    async with session_maker() as session:
+        logger.debug(f"[DB_OP] Read session created in {time.time() - start_time:.4f}s")
+        yield session
+
+
+async def get_uow_db() -> AsyncSession:
+    """FastAPI dependency for a request-scoped unit of work
+
+    Services only flush on this session; it is committed once after the handler
+    returns and rolled back (by closing it) if the handler raises. Opt in on
+    handlers that perform several writes, with ``Depends(get_uow_db, scope="function")``:
+    the default request scope runs the commit after the response has been sent, so a
+    failed commit would go unnoticed and clients could act on uncommitted data.
+    """
+    start_time = time.time()
+    session_maker = await _get_session_maker()
+
+    async with session_maker() as session:
+        session.info[UNIT_OF_WORK_KEY] = True
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"Unit of work rolled back: {e}", exc_info=True)
+            raise
+        await session.commit()
+        logger.debug(f"[DB_OP] Unit of work committed after {time.time() - start_time:.4f}s")
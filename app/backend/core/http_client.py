@@ -0,0 +1,48 @@
+import asyncio
+import logging
+from importlib.util import find_spec
+from typing import Optional
+
+import httpx
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]"); otherwise HTTP/1.1 keep-alive
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Process-wide AsyncClient whose connection pool is shared by all outbound provider calls
+
+    Reusing it keeps TCP/TLS connections alive across requests instead of paying a
+    handshake per call. A new client is created if the previous one was closed or
+    belongs to another event loop (Lambda may run invocations on fresh loops).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout),
+        )
+        _client_loop = loop
+        logger.debug(f"Created shared HTTP client (http2={HTTP2_AVAILABLE})")
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client; safe to call when it was never created"""
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
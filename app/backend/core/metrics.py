@@ -0,0 +1,211 @@
+import bisect
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Histogram upper bounds in seconds, shared by checkout wait and statement latency
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Distinct normalized statements tracked per engine; the rest are folded into "other"
+MAX_STATEMENT_SERIES = 500
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDERS = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?|__\[POSTCOMPILE_\w+\]")
+_VALUE_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """Reduce a SQL string to its shape: literals and bind placeholders become ``?``"""
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _PLACEHOLDERS.sub("?", sql)
+    sql = _LITERALS.sub("?", sql)
+    sql = _VALUE_LISTS.sub("(?)", sql)
+    return sql[:200]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class EngineMetrics:
+    """Pool and statement metrics for one engine"""
+
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.checkout_wait = Histogram()
+        self.checkouts = 0
+        self.connections = 0
+        self.invalidations = 0
+        self.slow_queries = 0
+        self.statements: Dict[str, Histogram] = {}
+
+    def observe_statement(self, statement: str, elapsed: float) -> None:
+        key = normalize_sql(statement)
+        histogram = self.statements.get(key)
+        if histogram is None:
+            if len(self.statements) >= MAX_STATEMENT_SERIES:
+                key = "other"
+                histogram = self.statements.setdefault(key, Histogram())
+            else:
+                histogram = self.statements[key] = Histogram()
+        histogram.observe(elapsed)
+
+        threshold_ms = settings.db_slow_query_ms
+        if threshold_ms and elapsed * 1000 >= threshold_ms:
+            self.slow_queries += 1
+            logger.warning(f"[DB_SLOW] {elapsed * 1000:.1f}ms on {self.name}: {key}")
+
+
+class DatabaseMetrics:
+    """Registry of instrumented engines, rendered in Prometheus text exposition format"""
+
+    def __init__(self):
+        self.engines: Dict[str, EngineMetrics] = {}
+
+    def get(self, name: str) -> Optional[EngineMetrics]:
+        return self.engines.get(name)
+
+    def instrument(self, engine, name: str = "primary") -> EngineMetrics:
+        """Attach event hooks to an AsyncEngine (or Engine) and start collecting under ``name``"""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        metrics = EngineMetrics(name, sync_engine)
+        self.engines[name] = metrics
+        pool = sync_engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = metrics
+
+        @event.listens_for(sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            metrics.connections += 1
+
+        @event.listens_for(sync_engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            metrics.checkouts += 1
+
+        @event.listens_for(sync_engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            metrics.invalidations += 1
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after_execute(conn, cursor, statement, parameters, context, executemany):
+            starts = conn.info.get("query_start_time")
+            if starts:
+                metrics.observe_statement(statement, time.perf_counter() - starts.pop())
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _on_error(exception_context):
+            # A failed statement never reaches after_cursor_execute; drop its start time so the
+            # per-connection stack does not grow for the life of the pooled connection
+            conn = exception_context.connection
+            if conn is not None and not conn.closed:
+                starts = conn.info.get("query_start_time")
+                if starts:
+                    starts.pop()
+
+        return metrics
+
+    def render(self) -> str:
+        families = {
+            "db_pool_checkout_wait_seconds": ("histogram", "Time spent acquiring a pooled connection"),
+            "db_pool_checkouts_total": ("counter", "Connections checked out of the pool"),
+            "db_pool_connections_total": ("counter", "New DBAPI connections opened"),
+            "db_pool_invalidations_total": ("counter", "Pooled connections invalidated"),
+            "db_pool_size": ("gauge", "Configured pool size"),
+            "db_pool_checked_out": ("gauge", "Connections currently checked out"),
+            "db_pool_overflow": ("gauge", "Connections currently open beyond pool_size"),
+            "db_slow_queries_total": ("counter", "Statements slower than DB_SLOW_QUERY_MS"),
+            "db_statement_duration_seconds": ("histogram", "Statement execution time by normalized SQL"),
+        }
+        samples: Dict[str, List[str]] = {family: [] for family in families}
+        for metrics in self.engines.values():
+            labels = f'engine="{_escape(metrics.name)}"'
+            pool = metrics.engine.pool
+            samples["db_pool_checkout_wait_seconds"] += metrics.checkout_wait.render(
+                "db_pool_checkout_wait_seconds", labels
+            )
+            samples["db_pool_checkouts_total"].append(f"db_pool_checkouts_total{{{labels}}} {metrics.checkouts}")
+            samples["db_pool_connections_total"].append(f"db_pool_connections_total{{{labels}}} {metrics.connections}")
+            samples["db_pool_invalidations_total"].append(
+                f"db_pool_invalidations_total{{{labels}}} {metrics.invalidations}"
+            )
+            if hasattr(pool, "size"):
+                samples["db_pool_size"].append(f"db_pool_size{{{labels}}} {pool.size()}")
+                samples["db_pool_checked_out"].append(f"db_pool_checked_out{{{labels}}} {pool.checkedout()}")
+                # QueuePool.overflow() counts up from -pool_size
+                samples["db_pool_overflow"].append(f"db_pool_overflow{{{labels}}} {max(pool.overflow(), 0)}")
+            samples["db_slow_queries_total"].append(f"db_slow_queries_total{{{labels}}} {metrics.slow_queries}")
+            for statement, histogram in metrics.statements.items():
+                samples["db_statement_duration_seconds"] += histogram.render(
+                    "db_statement_duration_seconds", f'{labels},statement="{_escape(statement)}"'
+                )
+
+        lines = []
+        for family, (kind, help_text) in families.items():
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+            lines.extend(samples[family])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times how long each checkout waits for a connection"""
+
+    metrics: Optional[EngineMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.metrics is not None:
+                self.metrics.checkout_wait.observe(time.perf_counter() - start)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+db_metrics = DatabaseMetrics()
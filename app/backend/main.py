@@ -16,6 +16,8 @@ from fastapi.routing import APIRouter
 from services.database import initialize_database, close_database
 from services.mock_data import initialize_mock_data
 from services.auth import initialize_admin_user
+from core.http_client import close_http_client
+from services.payment_events import start_payment_event_worker, stop_payment_event_worker
 # MODULE_IMPORTS_END
 
 
@@ -69,12 +71,15 @@ async def lifespan(app: FastAPI):
     await initialize_database()
     await initialize_mock_data()
     await initialize_admin_user()
+    await start_payment_event_worker()
     # MODULE_STARTUP_END
 
     logger.info("=== Application startup completed successfully ===")
     yield
     # MODULE_SHUTDOWN_START
+    await stop_payment_event_worker()
     await close_database()
+    await close_http_client()
     # MODULE_SHUTDOWN_END
 
 
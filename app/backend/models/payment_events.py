@@ -0,0 +1,34 @@
+from core.database import Base
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+
+class Payment_events(Base):
+    """Raw provider webhook deliveries, appended as received and processed asynchronously"""
+
+    __tablename__ = "payment_events"
+    __table_args__ = (
+        # Worker backlog scan: unprocessed events in arrival order
+        Index("ix_payment_events_status_id", "status", "id"),
+        Index("ix_payment_events_external_id", "external_id"),
+        # One row per provider delivery ID; retried deliveries hit this and are dropped
+        Index("ix_payment_events_provider_event_id", "provider", "event_id", unique=True),
+        {"extend_existing": True},
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True, nullable=False)
+    provider = Column(String, nullable=False)
+    event_id = Column(String, nullable=True)
+    event_type = Column(String, nullable=True)
+    external_id = Column(String, nullable=True)
+    # Merchant whose webhook secret verified the delivery; None for platform-account deliveries
+    user_id = Column(String, nullable=True)
+    payload = Column(Text, nullable=False)
+    # received -> processing -> processed | ignored | failed (failed events are retried up to
+    # PAYMENT_EVENT_MAX_ATTEMPTS); attempts counts claims
+    status = Column(String, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    # Earliest time the event may be claimed: retry backoff for failed events, claim expiry for processing ones
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    error = Column(String, nullable=True)
+    received_at = Column(DateTime(timezone=True), nullable=False)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
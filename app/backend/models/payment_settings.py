@@ -1,16 +1,22 @@
 from core.database import Base
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
 
 
 class Payment_settings(Base):
     __tablename__ = "payment_settings"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_payment_settings_user_id_id", "user_id", "id"),
+        Index("ix_payment_settings_user_id_provider", "user_id", "provider"),
+        {"extend_existing": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True, nullable=False)
     user_id = Column(String, nullable=False)
     provider = Column(String, nullable=False)
     public_key = Column(String, nullable=True)
     secret_key = Column(String, nullable=True)
+    # Stripe endpoint signing secret or Xendit callback token for /api/v1/payments/webhooks/{provider}/{id}
+    webhook_secret = Column(String, nullable=True)
     is_active = Column(Boolean, nullable=True)
     environment = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=True)
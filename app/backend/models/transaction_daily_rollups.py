@@ -0,0 +1,19 @@
+from core.database import Base
+from sqlalchemy import Column, Date, DateTime, Float, Integer, String, UniqueConstraint, func
+
+
+class Transaction_daily_rollups(Base):
+    __tablename__ = "transaction_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", "currency", "status", name="uq_transaction_daily_rollups_key"),
+        {"extend_existing": True},
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True, nullable=False)
+    user_id = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+    currency = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    transaction_count = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Float, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
\ No newline at end of file
@@ -1,10 +1,18 @@
 from core.database import Base
-from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String
 
 
 class Transactions(Base):
     __tablename__ = "transactions"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # User-scoped list/sort paths: every router query filters on user_id first
+        Index("ix_transactions_user_id_id", "user_id", "id"),
+        Index("ix_transactions_user_id_created_at", "user_id", "created_at"),
+        Index("ix_transactions_user_id_status", "user_id", "status"),
+        # external_id is the merchant's own reference, so it is only unique per user
+        Index("ix_transactions_user_id_external_id", "user_id", "external_id", unique=True),
+        {"extend_existing": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True, nullable=False)
     user_id = Column(String, nullable=False)
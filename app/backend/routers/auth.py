@@ -15,7 +15,7 @@ from core.auth import (
     validate_id_token,
 )
 from core.config import settings
-from core.database import get_db
+from core.database import get_db, get_uow_db
 from dependencies.auth import get_current_user
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
@@ -104,9 +104,13 @@ async def callback(
     code: Optional[str] = None,
     state: Optional[str] = None,
     error: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_uow_db, scope="function"),
 ):
-    """Handle OIDC callback."""
+    """Handle OIDC callback.
+
+    Runs as a unit of work: the state deletion and the user upsert commit together once,
+    before the redirect carrying the new token is sent.
+    """
     backend_url = get_dynamic_backend_url(request)
 
     def redirect_with_error(message: str) -> RedirectResponse:
@@ -220,6 +224,8 @@ async def callback(
         return redirect_with_error(str(e.detail))
     except Exception as e:
         logger.exception(f"Unexpected error in OIDC callback: {e}")
+        # The error is answered with a redirect, so discard the failed unit of work ourselves
+        await db.rollback()
         return redirect_with_error(
             "Authentication processing failed. Please try again or contact support if the issue persists."
         )
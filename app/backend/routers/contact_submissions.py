@@ -5,6 +5,8 @@ from typing import List, Optional
 from datetime import datetime, date
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -55,7 +57,7 @@ class Contact_submissionsResponse(BaseModel):
 class Contact_submissionsListResponse(BaseModel):
     """List response schema"""
     items: List[Contact_submissionsResponse]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
 
@@ -89,6 +91,7 @@ async def query_contact_submissionss(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=2000, description="Max number of records to return"),
     fields: str = Query(None, description="Comma-separated list of fields to return"),
+    count: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total count mode: exact, estimate or none"),
     db: AsyncSession = Depends(get_db),
 ):
     """Query contact_submissionss with filtering, sorting, and pagination"""
@@ -104,16 +107,24 @@ async def query_contact_submissionss(
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid query JSON format")
         
+        field_list = [f for f in fields.split(",") if f.strip()] if fields else None
         result = await service.get_list(
             skip=skip, 
             limit=limit,
             query_dict=query_dict,
             sort=sort,
+            fields=field_list,
+            count=count,
         )
         logger.debug(f"Found {result['total']} contact_submissionss")
+        if field_list:
+            # Projected rows are plain dicts; skip full response-model validation
+            return JSONResponse(content=jsonable_encoder(result))
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error querying contact_submissionss: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -126,6 +137,7 @@ async def query_contact_submissionss_all(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=2000, description="Max number of records to return"),
     fields: str = Query(None, description="Comma-separated list of fields to return"),
+    count: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total count mode: exact, estimate or none"),
     db: AsyncSession = Depends(get_db),
 ):
     # Query contact_submissionss with filtering, sorting, and pagination without user limitation
@@ -141,16 +153,24 @@ async def query_contact_submissionss_all(
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid query JSON format")
 
+        field_list = [f for f in fields.split(",") if f.strip()] if fields else None
         result = await service.get_list(
             skip=skip,
             limit=limit,
             query_dict=query_dict,
-            sort=sort
+            sort=sort,
+            fields=field_list,
+            count=count,
         )
         logger.debug(f"Found {result['total']} contact_submissionss")
+        if field_list:
+            # Projected rows are plain dicts; skip full response-model validation
+            return JSONResponse(content=jsonable_encoder(result))
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error querying contact_submissionss: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -213,13 +233,9 @@ async def create_contact_submissionss_batch(
     logger.debug(f"Batch creating {len(request.items)} contact_submissionss")
     
     service = Contact_submissionsService(db)
-    results = []
     
     try:
-        for item_data in request.items:
-            result = await service.create(item_data.model_dump())
-            if result:
-                results.append(result)
+        results = await service.create_batch([item_data.model_dump() for item_data in request.items])
         
         logger.info(f"Batch created {len(results)} contact_submissionss successfully")
         return results
@@ -238,15 +254,12 @@ async def update_contact_submissionss_batch(
     logger.debug(f"Batch updating {len(request.items)} contact_submissionss")
     
     service = Contact_submissionsService(db)
-    results = []
     
     try:
-        for item in request.items:
-            # Only include non-None values for partial updates
-            update_dict = {k: v for k, v in item.updates.model_dump().items() if v is not None}
-            result = await service.update(item.id, update_dict)
-            if result:
-                results.append(result)
+        # Only include non-None values for partial updates
+        results = await service.bulk_update(
+            [(item.id, {k: v for k, v in item.updates.model_dump().items() if v is not None}) for item in request.items]
+        )
         
         logger.info(f"Batch updated {len(results)} contact_submissionss successfully")
         return results
@@ -295,16 +308,17 @@ async def delete_contact_submissionss_batch(
     logger.debug(f"Batch deleting {len(request.ids)} contact_submissionss")
     
     service = Contact_submissionsService(db)
-    deleted_count = 0
     
     try:
-        for item_id in request.ids:
-            success = await service.delete(item_id)
-            if success:
-                deleted_count += 1
+        deleted_ids = await service.bulk_delete(request.ids)
+        deleted_count = len(deleted_ids)
         
         logger.info(f"Batch deleted {deleted_count} contact_submissionss successfully")
-        return {"message": f"Successfully deleted {deleted_count} contact_submissionss", "deleted_count": deleted_count}
+        return {
+            "message": f"Successfully deleted {deleted_count} contact_submissionss",
+            "deleted_count": deleted_count,
+            "deleted_ids": deleted_ids,
+        }
     except Exception as e:
         await db.rollback()
         logger.error(f"Error in batch delete: {str(e)}", exc_info=True)
@@ -0,0 +1,25 @@
+import hmac
+from typing import Optional
+
+from core.config import settings
+from core.metrics import db_metrics
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["metrics"])
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_metrics(authorization: Optional[str] = Header(None)):
+    """Database pool and statement metrics in Prometheus text format
+
+    Requires ``Authorization: Bearer <METRICS_TOKEN>``. Statement labels carry normalized
+    SQL, so the endpoint is only served without a token when METRICS_PUBLIC is set.
+    """
+    if settings.metrics_token:
+        expected = f"Bearer {settings.metrics_token}"
+        if not authorization or not hmac.compare_digest(authorization, expected):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    elif not settings.metrics_public:
+        raise HTTPException(status_code=403, detail="Metrics are disabled; set METRICS_TOKEN to enable them")
+    return PlainTextResponse(db_metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
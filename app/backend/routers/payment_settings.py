@@ -5,7 +5,9 @@ from typing import List, Optional
 from datetime import datetime, date
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_db
@@ -18,6 +20,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/entities/payment_settings", tags=["payment_settings"])
 
+# Accepted on create/update but never returned, filtered or sorted on; responses only say whether one is set
+WRITE_ONLY_FIELDS = frozenset({"webhook_secret"})
+
+
+def _readable_fields(fields: Optional[str], sort: Optional[str], query_dict: Optional[dict]) -> Optional[List[str]]:
+    """Parse ``fields`` minus write-only columns; 400 when ``sort`` or ``query`` reference one"""
+    if (sort and sort.strip().lstrip("-") in WRITE_ONLY_FIELDS) or WRITE_ONLY_FIELDS & set(query_dict or {}):
+        raise HTTPException(status_code=400, detail="webhook_secret cannot be queried or sorted on")
+    if not fields:
+        return None
+    return [f for f in fields.split(",") if f.strip() and f.strip() not in WRITE_ONLY_FIELDS] or None
+
 
 # ---------- Pydantic Schemas ----------
 class Payment_settingsData(BaseModel):
@@ -25,6 +39,7 @@ class Payment_settingsData(BaseModel):
     provider: str
     public_key: str = None
     secret_key: str = None
+    webhook_secret: str = None
     is_active: bool = None
     environment: str = None
     created_at: Optional[datetime] = None
@@ -36,6 +51,7 @@ class Payment_settingsUpdateData(BaseModel):
     provider: Optional[str] = None
     public_key: Optional[str] = None
     secret_key: Optional[str] = None
+    webhook_secret: Optional[str] = None
     is_active: Optional[bool] = None
     environment: Optional[str] = None
     created_at: Optional[datetime] = None
@@ -49,11 +65,17 @@ class Payment_settingsResponse(BaseModel):
     provider: str
     public_key: Optional[str] = None
     secret_key: Optional[str] = None
+    has_webhook_secret: bool = Field(False, validation_alias="webhook_secret")
     is_active: Optional[bool] = None
     environment: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    @field_validator("has_webhook_secret", mode="before")
+    @classmethod
+    def _mask_webhook_secret(cls, value):
+        return bool(value)
+
     class Config:
         from_attributes = True
 
@@ -61,7 +83,7 @@ class Payment_settingsResponse(BaseModel):
 class Payment_settingsListResponse(BaseModel):
     """List response schema"""
     items: List[Payment_settingsResponse]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
 
@@ -95,6 +117,7 @@ async def query_payment_settingss(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=2000, description="Max number of records to return"),
     fields: str = Query(None, description="Comma-separated list of fields to return"),
+    count: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total count mode: exact, estimate or none"),
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -111,17 +134,25 @@ async def query_payment_settingss(
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid query JSON format")
         
+        field_list = _readable_fields(fields, sort, query_dict)
         result = await service.get_list(
             skip=skip, 
             limit=limit,
             query_dict=query_dict,
             sort=sort,
             user_id=str(current_user.id),
+            fields=field_list,
+            count=count,
         )
         logger.debug(f"Found {result['total']} payment_settingss")
+        if field_list:
+            # Projected rows are plain dicts; skip full response-model validation
+            return JSONResponse(content=jsonable_encoder(result))
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error querying payment_settingss: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -134,6 +165,7 @@ async def query_payment_settingss_all(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=2000, description="Max number of records to return"),
     fields: str = Query(None, description="Comma-separated list of fields to return"),
+    count: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total count mode: exact, estimate or none"),
     db: AsyncSession = Depends(get_db),
 ):
     # Query payment_settingss with filtering, sorting, and pagination without user limitation
@@ -149,16 +181,24 @@ async def query_payment_settingss_all(
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid query JSON format")
 
+        field_list = _readable_fields(fields, sort, query_dict)
         result = await service.get_list(
             skip=skip,
             limit=limit,
             query_dict=query_dict,
-            sort=sort
+            sort=sort,
+            fields=field_list,
+            count=count,
         )
         logger.debug(f"Found {result['total']} payment_settingss")
+        if field_list:
+            # Projected rows are plain dicts; skip full response-model validation
+            return JSONResponse(content=jsonable_encoder(result))
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error querying payment_settingss: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -224,13 +264,11 @@ async def create_payment_settingss_batch(
     logger.debug(f"Batch creating {len(request.items)} payment_settingss")
     
     service = Payment_settingsService(db)
-    results = []
     
     try:
-        for item_data in request.items:
-            result = await service.create(item_data.model_dump(), user_id=str(current_user.id))
-            if result:
-                results.append(result)
+        results = await service.create_batch(
+            [item_data.model_dump() for item_data in request.items], user_id=str(current_user.id)
+        )
         
         logger.info(f"Batch created {len(results)} payment_settingss successfully")
         return results
@@ -250,15 +288,13 @@ async def update_payment_settingss_batch(
     logger.debug(f"Batch updating {len(request.items)} payment_settingss")
     
     service = Payment_settingsService(db)
-    results = []
     
     try:
-        for item in request.items:
-            # Only include non-None values for partial updates
-            update_dict = {k: v for k, v in item.updates.model_dump().items() if v is not None}
-            result = await service.update(item.id, update_dict, user_id=str(current_user.id))
-            if result:
-                results.append(result)
+        # Only include non-None values for partial updates
+        results = await service.bulk_update(
+            [(item.id, {k: v for k, v in item.updates.model_dump().items() if v is not None}) for item in request.items],
+            user_id=str(current_user.id),
+        )
         
         logger.info(f"Batch updated {len(results)} payment_settingss successfully")
         return results
@@ -309,16 +345,17 @@ async def delete_payment_settingss_batch(
     logger.debug(f"Batch deleting {len(request.ids)} payment_settingss")
     
     service = Payment_settingsService(db)
-    deleted_count = 0
     
     try:
-        for item_id in request.ids:
-            success = await service.delete(item_id, user_id=str(current_user.id))
-            if success:
-                deleted_count += 1
+        deleted_ids = await service.bulk_delete(request.ids, user_id=str(current_user.id))
+        deleted_count = len(deleted_ids)
         
         logger.info(f"Batch deleted {deleted_count} payment_settingss successfully")
-        return {"message": f"Successfully deleted {deleted_count} payment_settingss", "deleted_count": deleted_count}
+        return {
+            "message": f"Successfully deleted {deleted_count} payment_settingss",
+            "deleted_count": deleted_count,
+            "deleted_ids": deleted_ids,
+        }
     except Exception as e:
         await db.rollback()
         logger.error(f"Error in batch delete: {str(e)}", exc_info=True)
@@ -0,0 +1,177 @@
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_db
+from dependencies.auth import get_current_user
+from schemas.auth import UserResponse
+from services.payment import CheckoutError
+from services.payment_gateway import (
+    GatewayCheckoutRequest,
+    GatewayCheckoutResponse,
+    GatewayCheckoutStatus,
+    get_payment_gateway,
+    invalidate_checkout_status,
+    lookup_checkout_status,
+)
+from services.payment_events import (
+    Payment_eventsService,
+    payment_event_worker,
+    process_payment_event,
+    recent_payment_events,
+)
+from services.payment_settings import Payment_settingsService
+from services.payment_webhooks import (
+    OWNER_METADATA_KEY,
+    WEBHOOK_PROVIDERS,
+    WebhookVerificationError,
+    describe_checkout,
+    describe_event,
+    verify_webhook,
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/payments", tags=["payments"])
+
+# HTTP status for each CheckoutError.error_type; anything else is a provider failure (502)
+_ERROR_STATUS = {
+    "validation": 400,
+    "card_error": 400,
+    "idempotency": 409,
+    "authentication": 400,
+    "not_found": 404,
+    "rate_limit": 429,
+}
+
+
+def _http_error(e: CheckoutError) -> HTTPException:
+    return HTTPException(status_code=_ERROR_STATUS.get(e.error_type, 502), detail=str(e))
+
+
+@router.post("/checkout/{provider}", response_model=GatewayCheckoutResponse)
+async def create_checkout(
+    provider: str,
+    request: GatewayCheckoutRequest,
+    environment: Optional[str] = Query(None, description="Payment settings environment (sandbox or production)"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create a hosted checkout with the current user's credentials for ``provider``"""
+    try:
+        gateway = await get_payment_gateway(db, str(current_user.id), provider, environment)
+        # Webhooks use this to attribute the transaction to the merchant
+        request.metadata = {**(request.metadata or {}), OWNER_METADATA_KEY: str(current_user.id)}
+        return await gateway.create_checkout(request)
+    except CheckoutError as e:
+        logger.warning(f"Checkout creation failed for provider {provider}: {e}")
+        raise _http_error(e)
+
+
+@router.get("/checkout/{provider}/{checkout_id}", response_model=GatewayCheckoutStatus)
+async def get_checkout_status(
+    provider: str,
+    checkout_id: str,
+    environment: Optional[str] = Query(None, description="Payment settings environment (sandbox or production)"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the normalized status of a checkout created through ``provider`` (cached for polling)"""
+    try:
+        return await lookup_checkout_status(db, str(current_user.id), provider, checkout_id, environment)
+    except CheckoutError as e:
+        logger.warning(f"Checkout status lookup failed for {provider} {checkout_id}: {e}")
+        raise _http_error(e)
+
+
+async def _ingest_webhook(
+    provider: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession,
+    secret: Optional[str] = None,
+    owner: Optional[str] = None,
+):
+    """Verify and store one delivery, then hand it to the payment event worker
+
+    ``secret`` and ``owner`` come from a merchant's payment_settings; without them the
+    platform secrets are used and the owner is read from the checkout metadata.
+    """
+    body = await request.body()
+    try:
+        payload = verify_webhook(provider, body, request.headers, secret)
+    except WebhookVerificationError as e:
+        logger.warning(f"Rejected {provider} webhook: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    event_id, event_type, external_id = describe_event(provider, payload, request.headers)
+    checkout_id, checkout_owner = describe_checkout(provider, payload)
+    if checkout_id:
+        # Pollers must see the change now, not when the open-checkout TTL runs out
+        invalidate_checkout_status(provider, checkout_id, owner or checkout_owner)
+    # Provider retries of an already stored delivery are acknowledged without touching the database
+    dedup_key = (provider, event_id)
+    if event_id and dedup_key in recent_payment_events:
+        return {"received": True, "duplicate": True}
+
+    event = await Payment_eventsService(db).record(
+        provider,
+        body.decode("utf-8"),
+        event_id=event_id,
+        event_type=event_type,
+        external_id=external_id,
+        user_id=owner,
+    )
+    if event_id:
+        recent_payment_events.add(dedup_key)
+    if event is None:
+        return {"received": True, "duplicate": True}
+    if not payment_event_worker.submit(event.id, external_id):
+        background_tasks.add_task(process_payment_event, event.id)
+    return {"received": True}
+
+
+@router.post("/webhooks/{provider}")
+async def receive_webhook(
+    provider: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """Verify and store a webhook from the platform's own provider account, then acknowledge it
+
+    Only the raw event is written here; transactions are updated by the payment event
+    worker (or, where no worker runs, e.g. on Lambda, after the response is sent).
+    """
+    if provider not in WEBHOOK_PROVIDERS:
+        raise HTTPException(status_code=404, detail=f"Unsupported webhook provider: {provider}")
+    return await _ingest_webhook(provider, request, background_tasks, db)
+
+
+@router.post("/webhooks/{provider}/{settings_id}")
+async def receive_merchant_webhook(
+    provider: str,
+    settings_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """Verify and store a webhook from a merchant's own provider account
+
+    Checkouts created through a merchant's payment_settings run on that merchant's
+    account, whose deliveries are signed with its own secret. Merchants register this
+    URL with the ID of their payment_settings row and store the endpoint signing
+    secret (Stripe) or callback token (Xendit) as its ``webhook_secret``; events are
+    attributed to that row's user.
+    """
+    if provider not in WEBHOOK_PROVIDERS:
+        raise HTTPException(status_code=404, detail=f"Unsupported webhook provider: {provider}")
+    setting = await Payment_settingsService(db).get_by_id(settings_id)
+    if setting is None or setting.provider != provider or setting.is_active is False or not setting.webhook_secret:
+        raise HTTPException(status_code=404, detail="No webhook endpoint configured for these payment settings")
+    return await _ingest_webhook(
+        provider, request, background_tasks, db, secret=setting.webhook_secret, owner=setting.user_id
+    )
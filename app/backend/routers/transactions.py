@@ -1,3 +1,5 @@
+import csv
+import io
 import json
 import logging
 from typing import List, Optional
@@ -5,11 +7,16 @@ from typing import List, Optional
 from datetime import datetime, date
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.database import db_manager, get_db, get_read_db
 from services.transactions import TransactionsService
+from models.transactions import Transactions
+from utils.query_filters import build_projection, compile_filter
 from dependencies.auth import get_current_user
 from schemas.auth import UserResponse
 
@@ -19,6 +26,26 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/entities/transactions", tags=["transactions"])
 
 
+# Returned instead of the database error, which would echo the statement and its parameters
+DUPLICATE_EXTERNAL_ID = "A transaction with this external_id already exists"
+
+# How each dialect names the (user_id, external_id) unique index in its error: Postgres/MySQL by name,
+# SQLite by its columns
+_EXTERNAL_ID_CONSTRAINT_MARKERS = (
+    "ix_transactions_user_id_external_id",
+    "transactions.user_id, transactions.external_id",
+)
+
+
+def _integrity_error(e: IntegrityError, action: str) -> HTTPException:
+    """409 for a duplicate external_id; any other constraint is a 500 without the statement text"""
+    if any(marker in str(e.orig) for marker in _EXTERNAL_ID_CONSTRAINT_MARKERS):
+        logger.warning(f"Duplicate external_id {action}")
+        return HTTPException(status_code=409, detail=DUPLICATE_EXTERNAL_ID)
+    logger.error(f"Constraint violation {action}: {str(e.orig)}", exc_info=True)
+    return HTTPException(status_code=500, detail="Internal server error: database constraint violated")
+
+
 # ---------- Pydantic Schemas ----------
 class TransactionsData(BaseModel):
     """Entity data schema (for create/update)"""
@@ -61,9 +88,27 @@ class TransactionsResponse(BaseModel):
 class TransactionsListResponse(BaseModel):
     """List response schema"""
     items: List[TransactionsResponse]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
+
+
+class TransactionsStatsGroup(BaseModel):
+    """Aggregated bucket; dimension fields are only set when grouped by them"""
+    status: Optional[str] = None
+    currency: Optional[str] = None
+    payment_method: Optional[str] = None
+    day: Optional[date] = None
+    count: int
+    total_amount: float
+
+
+class TransactionsStatsResponse(BaseModel):
+    """Stats response schema"""
+    groups: List[TransactionsStatsGroup]
+    total_count: int
+    total_amount: float
 
 
 class TransactionsBatchCreateRequest(BaseModel):
@@ -95,8 +140,10 @@ async def query_transactionss(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=2000, description="Max number of records to return"),
     fields: str = Query(None, description="Comma-separated list of fields to return"),
+    cursor: str = Query(None, description="Keyset pagination cursor (empty for the first page); ignores skip"),
+    count: str = Query(None, pattern="^(exact|estimate|none)$", description="Total count mode: exact, estimate or none (default: exact for offset, none for cursor paging)"),
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Query transactionss with filtering, sorting, and pagination (user can only see their own records)"""
     logger.debug(f"Querying transactionss: query={query}, sort={sort}, skip={skip}, limit={limit}, fields={fields}")
@@ -111,17 +158,26 @@ async def query_transactionss(
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid query JSON format")
         
+        field_list = [f for f in fields.split(",") if f.strip()] if fields else None
         result = await service.get_list(
             skip=skip, 
             limit=limit,
             query_dict=query_dict,
             sort=sort,
             user_id=str(current_user.id),
+            cursor=cursor,
+            count=count or ("exact" if cursor is None else "none"),
+            fields=field_list,
         )
         logger.debug(f"Found {result['total']} transactionss")
+        if field_list:
+            # Projected rows are plain dicts; skip full response-model validation
+            return JSONResponse(content=jsonable_encoder(result))
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error querying transactionss: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -134,7 +190,9 @@ async def query_transactionss_all(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=2000, description="Max number of records to return"),
     fields: str = Query(None, description="Comma-separated list of fields to return"),
-    db: AsyncSession = Depends(get_db),
+    cursor: str = Query(None, description="Keyset pagination cursor (empty for the first page); ignores skip"),
+    count: str = Query(None, pattern="^(exact|estimate|none)$", description="Total count mode: exact, estimate or none (default: exact for offset, none for cursor paging)"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     # Query transactionss with filtering, sorting, and pagination without user limitation
     logger.debug(f"Querying transactionss: query={query}, sort={sort}, skip={skip}, limit={limit}, fields={fields}")
@@ -149,27 +207,143 @@ async def query_transactionss_all(
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid query JSON format")
 
+        field_list = [f for f in fields.split(",") if f.strip()] if fields else None
         result = await service.get_list(
             skip=skip,
             limit=limit,
             query_dict=query_dict,
-            sort=sort
+            sort=sort,
+            cursor=cursor,
+            count=count or ("exact" if cursor is None else "none"),
+            fields=field_list,
         )
         logger.debug(f"Found {result['total']} transactionss")
+        if field_list:
+            # Projected rows are plain dicts; skip full response-model validation
+            return JSONResponse(content=jsonable_encoder(result))
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error querying transactionss: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get("/stats", response_model=TransactionsStatsResponse)
+async def get_transactionss_stats(
+    group_by: str = Query(None, description="Comma-separated dimensions: status, currency, day, payment_method"),
+    start: Optional[datetime] = Query(None, description="Only include transactions created at or after this time"),
+    end: Optional[datetime] = Query(None, description="Only include transactions created before this time"),
+    query: str = Query(None, description="Query conditions (JSON string)"),
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Aggregate transactionss (count and amount sum) in SQL (user can only see their own records)"""
+    logger.debug(f"Aggregating transactionss: group_by={group_by}, start={start}, end={end}, query={query}")
+
+    service = TransactionsService(db)
+    try:
+        query_dict = None
+        if query:
+            try:
+                query_dict = json.loads(query)
+            except json.JSONDecodeError:
+                raise HTTPException(status_code=400, detail="Invalid query JSON format")
+
+        dimensions = [d.strip() for d in group_by.split(",") if d.strip()] if group_by else []
+        groups = await service.aggregate(
+            group_by=dimensions,
+            user_id=str(current_user.id),
+            start=start,
+            end=end,
+            query_dict=query_dict,
+        )
+        return {
+            "groups": groups,
+            "total_count": sum(group["count"] for group in groups),
+            "total_amount": sum(group["total_amount"] for group in groups),
+        }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error aggregating transactionss: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@router.get("/export")
+async def export_transactionss(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Export format: ndjson or csv"),
+    query: str = Query(None, description="Query conditions (JSON string)"),
+    sort: str = Query(None, description="Sort field (prefix with '-' for descending)"),
+    fields: str = Query(None, description="Comma-separated list of fields to return"),
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """Stream all matching transactionss as NDJSON or CSV (user can only see their own records)"""
+    logger.debug(f"Exporting transactionss: format={format}, query={query}, sort={sort}, fields={fields}")
+
+    query_dict = None
+    if query:
+        try:
+            query_dict = json.loads(query)
+        except json.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="Invalid query JSON format")
+    field_list = [f for f in fields.split(",") if f.strip()] if fields else None
+    try:
+        # Validate up front; errors raised mid-stream can no longer change the status code
+        compile_filter(Transactions, query_dict)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    columns = [c.name for c in build_projection(Transactions, field_list) or Transactions.__table__.columns]
+
+    if not db_manager.async_session_maker:
+        await db_manager.ensure_initialized()
+    user_id = str(current_user.id)
+
+    async def body():
+        # The request-scoped session is closed before the body streams, so use a dedicated one
+        session_maker = db_manager.read_session_maker or db_manager.async_session_maker
+        async with session_maker() as db:
+            service = TransactionsService(db)
+            chunks = service.stream_export(user_id=user_id, query_dict=query_dict, sort=sort, fields=field_list)
+            if format == "csv":
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=columns)
+                writer.writeheader()
+                async for rows in chunks:
+                    writer.writerows(rows)
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                if buffer.tell():
+                    yield buffer.getvalue()
+            else:
+                async for rows in chunks:
+                    yield "".join(json.dumps(row, default=_json_default) + "\n" for row in rows)
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transactions.{format}"'},
+    )
+
+
 @router.get("/{id}", response_model=TransactionsResponse)
 async def get_transactions(
     id: int,
     fields: str = Query(None, description="Comma-separated list of fields to return"),
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get a single transactions by ID (user can only see their own records)"""
     logger.debug(f"Fetching transactions with id: {id}, fields={fields}")
@@ -209,6 +383,8 @@ async def create_transactions(
     except ValueError as e:
         logger.error(f"Validation error creating transactions: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        raise _integrity_error(e, "creating transactions")
     except Exception as e:
         logger.error(f"Error creating transactions: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -224,16 +400,17 @@ async def create_transactionss_batch(
     logger.debug(f"Batch creating {len(request.items)} transactionss")
     
     service = TransactionsService(db)
-    results = []
     
     try:
-        for item_data in request.items:
-            result = await service.create(item_data.model_dump(), user_id=str(current_user.id))
-            if result:
-                results.append(result)
+        results = await service.create_batch(
+            [item_data.model_dump() for item_data in request.items], user_id=str(current_user.id)
+        )
         
         logger.info(f"Batch created {len(results)} transactionss successfully")
         return results
+    except IntegrityError as e:
+        await db.rollback()
+        raise _integrity_error(e, "in batch create")
     except Exception as e:
         await db.rollback()
         logger.error(f"Error in batch create: {str(e)}", exc_info=True)
@@ -250,18 +427,19 @@ async def update_transactionss_batch(
     logger.debug(f"Batch updating {len(request.items)} transactionss")
     
     service = TransactionsService(db)
-    results = []
     
     try:
-        for item in request.items:
-            # Only include non-None values for partial updates
-            update_dict = {k: v for k, v in item.updates.model_dump().items() if v is not None}
-            result = await service.update(item.id, update_dict, user_id=str(current_user.id))
-            if result:
-                results.append(result)
+        # Only include non-None values for partial updates
+        results = await service.bulk_update(
+            [(item.id, {k: v for k, v in item.updates.model_dump().items() if v is not None}) for item in request.items],
+            user_id=str(current_user.id),
+        )
         
         logger.info(f"Batch updated {len(results)} transactionss successfully")
         return results
+    except IntegrityError as e:
+        await db.rollback()
+        raise _integrity_error(e, "in batch update")
     except Exception as e:
         await db.rollback()
         logger.error(f"Error in batch update: {str(e)}", exc_info=True)
@@ -294,6 +472,8 @@ async def update_transactions(
     except ValueError as e:
         logger.error(f"Validation error updating transactions {id}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        raise _integrity_error(e, f"updating transactions {id}")
     except Exception as e:
         logger.error(f"Error updating transactions {id}: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -309,16 +489,17 @@ async def delete_transactionss_batch(
     logger.debug(f"Batch deleting {len(request.ids)} transactionss")
     
     service = TransactionsService(db)
-    deleted_count = 0
     
     try:
-        for item_id in request.ids:
-            success = await service.delete(item_id, user_id=str(current_user.id))
-            if success:
-                deleted_count += 1
+        deleted_ids = await service.bulk_delete(request.ids, user_id=str(current_user.id))
+        deleted_count = len(deleted_ids)
         
         logger.info(f"Batch deleted {deleted_count} transactionss successfully")
-        return {"message": f"Successfully deleted {deleted_count} transactionss", "deleted_count": deleted_count}
+        return {
+            "message": f"Successfully deleted {deleted_count} transactionss",
+            "deleted_count": deleted_count,
+            "deleted_ids": deleted_ids,
+        }
     except Exception as e:
         await db.rollback()
         logger.error(f"Error in batch delete: {str(e)}", exc_info=True)
@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional, Tuple
 
 from core.auth import create_access_token
 from core.config import settings
-from core.database import db_manager
+from core.database import commit_or_flush, db_manager
 from models.auth import OIDCState, User
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -39,7 +39,7 @@ class AuthService:
 
         start_time_commit = time.time()
         logger.debug("[DB_OP] Starting user commit/refresh")
-        await self.db.commit()
+        await commit_or_flush(self.db)
         await self.db.refresh(user)
         logger.debug(f"[DB_OP] User commit/refresh completed in {time.time() - start_time_commit:.4f}s")
         return user
@@ -80,7 +80,7 @@ class AuthService:
         oidc_state = OIDCState(state=state, nonce=nonce, code_verifier=code_verifier, expires_at=expires_at)
 
         self.db.add(oidc_state)
-        await self.db.commit()
+        await commit_or_flush(self.db)
 
     async def get_and_delete_oidc_state(self, state: str) -> Optional[dict]:
         """Get and delete OIDC state from database."""
@@ -99,7 +99,7 @@ class AuthService:
 
         # Delete the used state (one-time use)
         await self.db.delete(oidc_state)
-        await self.db.commit()
+        await commit_or_flush(self.db)
 
         return state_data
 
@@ -0,0 +1,617 @@
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy import DateTime, and_, bindparam, delete, exists, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from core.database import Base, commit_or_flush
+from utils.query_counts import count_rows
+from utils.query_filters import build_projection, compile_filter
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+# Upper bound on ids per IN (...) list, well below driver bind-parameter limits
+BULK_CHUNK_SIZE = 1000
+
+# Rows fetched per server-side cursor round trip when exporting
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _encode_cursor(sort_key: str, value: Any, last_id: int) -> str:
+    """Encode the keyset position (sort value + id) into an opaque URL-safe token"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort_key, "v": value, "id": last_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_key: str, column) -> Tuple[Any, int]:
+    """Decode a cursor produced by _encode_cursor and validate it against the current sort"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value, last_id = payload["v"], int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {str(e)}")
+    if payload.get("s") != sort_key:
+        raise ValueError("Cursor does not match the requested sort order")
+    if value is not None and isinstance(column.type, DateTime):
+        value = datetime.fromisoformat(value)
+    return value, last_id
+
+
+# ------------------ Service Layer ------------------
+class EntityService(Generic[ModelT]):
+    """Generic CRUD service for a single-table entity with an integer ``id``
+
+    Subclasses only set ``model``. Column maps and statement templates are built once
+    per subclass, so requests never rebuild them or fall back to ``hasattr`` lookups.
+    Entities with a ``user_id`` column are user-scoped: passing ``user_id`` restricts
+    every read and write to that user's rows, and ``user_id`` is never updatable.
+
+    Services that maintain derived data override ``_track_row`` / ``_apply_tracked``;
+    they are called with every row added (sign=1) or removed (sign=-1) before commit.
+    Bulk paths only load old values when an update touches ``tracked_fields``.
+    """
+
+    model: Type[ModelT]
+    tracked_fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model = cls.__dict__.get("model")
+        if model is None:
+            return
+        table = model.__table__
+        cls.entity_name = table.name
+        cls._columns = dict(table.columns.items())
+        cls._user_scoped = "user_id" in cls._columns
+        protected = ("id", "user_id") if cls._user_scoped else ("id",)
+        cls._writable = frozenset(name for name in cls._columns if name not in protected)
+        cls._tracked_columns = [cls._columns[name] for name in cls.tracked_fields]
+
+        # Statement templates keyed by ownership scope; "owner_id" avoids the names UPDATE reserves for SET
+        by_id = model.id == bindparam("obj_id")
+        scopes = {False: [by_id]}
+        if cls._user_scoped:
+            scopes[True] = [by_id, model.user_id == bindparam("owner_id")]
+        cls._get_by_id_stmts = {owned: select(model).where(*where) for owned, where in scopes.items()}
+        cls._update_by_id_stmts = {
+            owned: update(model).where(*where).execution_options(synchronize_session=False)
+            for owned, where in scopes.items()
+        }
+        cls._delete_by_id_stmts = {
+            owned: delete(model).where(*where).execution_options(synchronize_session=False)
+            for owned, where in scopes.items()
+        }
+        cls._tracked_by_id_stmts = {
+            owned: select(*cls._tracked_columns).where(*where).with_for_update()
+            for owned, where in scopes.items()
+        }
+        if cls._user_scoped:
+            cls._exists_owned_stmt = select(exists().where(*scopes[True]))
+        cls._insert_stmt = insert(model).returning(model)
+        cls._count_stmt = select(func.count(model.id))
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ---------- Hooks ----------
+    def _prepare_row(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in derived values before a row is inserted"""
+        return data
+
+    def _track_row(self, row: Any, sign: int = 1) -> None:
+        """Record a row added to (sign=1) or removed from (sign=-1) the table"""
+
+    async def _apply_tracked(self) -> None:
+        """Write derived data for the tracked rows (does not commit)"""
+
+    # ---------- Helpers ----------
+    def _owned(self, conditions: List, user_id: Optional[str]) -> List:
+        if user_id:
+            conditions.append(self.model.user_id == user_id)
+        return conditions
+
+    def _resolve_sort(self, sort: Optional[str]) -> Tuple[Optional[str], bool]:
+        """Split ``sort`` into (column name, descending); unknown columns resolve to None"""
+        if not sort:
+            return None, False
+        descending = sort.startswith('-')
+        field_name = sort[1:] if descending else sort
+        if field_name not in self._columns:
+            return None, False
+        return field_name, descending
+
+    def _field_column(self, field_name: str):
+        column = self._columns.get(field_name)
+        if column is None:
+            raise ValueError(f"Field {field_name} does not exist on {self.model.__name__}")
+        return column
+
+    async def _insert_rows(self, rows: List[Dict[str, Any]]) -> List[ModelT]:
+        """INSERT ... RETURNING full rows, so server defaults come back without a refresh"""
+        if self.db.get_bind().dialect.insert_returning:
+            return (await self.db.scalars(self._insert_stmt, rows)).all()
+        # No RETURNING (e.g. SQLite < 3.35): flush, then reload server defaults in one SELECT per chunk
+        objs = [self.model(**row) for row in rows]
+        self.db.add_all(objs)
+        await self.db.flush()
+        ids = [obj.id for obj in objs]
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            await self.db.scalars(
+                select(self.model).where(self.model.id.in_(ids[start:start + BULK_CHUNK_SIZE]))
+                .execution_options(populate_existing=True)
+            )
+        return objs
+
+    # ---------- CRUD ----------
+    async def create(self, data: Dict[str, Any], user_id: Optional[str] = None) -> Optional[ModelT]:
+        """Create a new record with a single INSERT ... RETURNING"""
+        try:
+            if user_id:
+                data['user_id'] = user_id
+            obj = (await self._insert_rows([self._prepare_row(data)]))[0]
+            self._track_row(obj)
+            await self._apply_tracked()
+            await commit_or_flush(self.db)
+            logger.info(f"Created {self.entity_name} with id: {obj.id}")
+            return obj
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error creating {self.entity_name}: {str(e)}")
+            raise
+
+    async def create_batch(self, items: List[Dict[str, Any]], user_id: Optional[str] = None) -> List[ModelT]:
+        """Create many records with a single multi-row INSERT ... RETURNING (all or nothing)"""
+        if not items:
+            return []
+        try:
+            rows = [self._prepare_row({**item, 'user_id': user_id} if user_id else dict(item)) for item in items]
+            objs = await self._insert_rows(rows)
+            for obj in objs:
+                self._track_row(obj)
+            await self._apply_tracked()
+            await commit_or_flush(self.db)
+            logger.info(f"Batch created {len(objs)} {self.entity_name}s")
+            return objs
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error batch creating {self.entity_name}s: {str(e)}")
+            raise
+
+    def _id_params(self, obj_id: int, user_id: Optional[str]) -> Tuple[bool, Dict[str, Any]]:
+        """Pick the statement scope and bind parameters for a single-record operation"""
+        if user_id:
+            return True, {"obj_id": obj_id, "owner_id": user_id}
+        return False, {"obj_id": obj_id}
+
+    async def check_ownership(self, obj_id: int, user_id: str) -> bool:
+        """Check if user owns this record with a SELECT EXISTS (no row is loaded)"""
+        try:
+            result = await self.db.execute(self._exists_owned_stmt, {"obj_id": obj_id, "owner_id": user_id})
+            return bool(result.scalar())
+        except Exception as e:
+            logger.error(f"Error checking ownership for {self.entity_name} {obj_id}: {str(e)}")
+            return False
+
+    async def get_by_id(self, obj_id: int, user_id: Optional[str] = None) -> Optional[ModelT]:
+        """Get a record by ID (user can only see their own records)"""
+        try:
+            owned, params = self._id_params(obj_id, user_id)
+            result = await self.db.execute(self._get_by_id_stmts[owned], params)
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Error fetching {self.entity_name} {obj_id}: {str(e)}")
+            raise
+
+    async def get_list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        user_id: Optional[str] = None,
+        query_dict: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        count: str = "exact",
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get a paginated list of records (user can only see their own records)
+
+        ``fields`` selects only those columns (plus ``id`` and the sort column) and
+        returns plain dicts instead of ORM objects.
+
+        ``count`` is ``exact``, ``estimate`` (planner statistics) or ``none`` (``total`` is None).
+
+        Passing ``cursor`` (an empty string for the first page) switches to keyset
+        pagination: ``skip`` is ignored, rows are ordered by the sort column plus ``id``
+        and the response carries a ``next_cursor`` for the following page.
+        """
+        try:
+            projection = build_projection(self.model, fields)
+            query = select(*projection) if projection else select(self.model)
+            conditions = self._owned([], user_id)
+            filter_clause = compile_filter(self.model, query_dict)
+            if filter_clause is not None:
+                conditions.append(filter_clause)
+            if conditions:
+                query = query.where(*conditions)
+
+            total = await count_rows(self.db, self._count_stmt.where(*conditions), count)
+
+            if cursor is not None:
+                return await self._get_keyset_page(query, limit, sort, cursor, total, projection)
+
+            field_name, descending = self._resolve_sort(sort)
+            if field_name is None:
+                query = query.order_by(self.model.id.desc())
+            else:
+                column = self._columns[field_name]
+                query = query.order_by(column.desc() if descending else column)
+
+            result = await self.db.execute(query.offset(skip).limit(limit))
+            if projection:
+                items = [row._asdict() for row in result]
+            else:
+                items = result.scalars().all()
+
+            return {
+                "items": items,
+                "total": total,
+                "skip": skip,
+                "limit": limit,
+            }
+        except Exception as e:
+            logger.error(f"Error fetching {self.entity_name} list: {str(e)}")
+            raise
+
+    async def _get_keyset_page(
+        self, query: Select, limit: int, sort: Optional[str], cursor: str, total: Optional[int], projection=None
+    ) -> Dict[str, Any]:
+        """Fetch one keyset page; unknown sort fields fall back to ``-id``"""
+        field_name, descending = self._resolve_sort(sort)
+        if field_name is None:
+            field_name, descending = "id", True
+        sort_key = f"-{field_name}" if descending else field_name
+        column = self._columns[field_name]
+        id_column = self._columns["id"]
+        if projection and column.key not in {c.key for c in projection}:
+            # The cursor is built from the last row's sort value
+            query = query.add_columns(column)
+
+        if cursor:
+            last_value, last_id = _decode_cursor(cursor, sort_key, column)
+            if field_name == "id":
+                query = query.where(id_column < last_id if descending else id_column > last_id)
+            else:
+                # NULLs are ordered last in both directions so the predicate is dialect independent
+                tie_break = id_column < last_id if descending else id_column > last_id
+                if last_value is None:
+                    query = query.where(and_(column.is_(None), tie_break))
+                else:
+                    past_value = column < last_value if descending else column > last_value
+                    query = query.where(
+                        or_(past_value, and_(column == last_value, tie_break), column.is_(None))
+                    )
+
+        if field_name == "id":
+            order_by = [id_column.desc() if descending else id_column.asc()]
+        else:
+            ordered = column.desc() if descending else column.asc()
+            if self.db.get_bind().dialect.name == "mysql":
+                # No NULLS LAST in MySQL: a leading IS NULL key (false sorts first) puts NULLs after values,
+                # matching the column.is_(None) branch of the cursor predicate
+                order_by = [column.is_(None), ordered]
+            else:
+                # Kept native elsewhere so the (user_id, column) indexes still serve the sort
+                order_by = [ordered.nulls_last()]
+            order_by.append(id_column.desc() if descending else id_column.asc())
+
+        # Fetch one extra row to learn whether another page exists without a second query
+        result = await self.db.execute(query.order_by(*order_by).limit(limit + 1))
+        items = result.all() if projection else result.scalars().all()
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = _encode_cursor(sort_key, getattr(last, field_name), last.id)
+        if projection:
+            items = [row._asdict() for row in items]
+
+        return {
+            "items": items,
+            "total": total,
+            "skip": 0,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
+
+    async def stream_export(
+        self,
+        user_id: Optional[str] = None,
+        query_dict: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield records as lists of dicts, read from a server-side cursor in ``chunk_size`` batches
+
+        Only one chunk is held in memory at a time, so exports of any size run in
+        constant memory. Rows are column-only selects; no ORM objects are built.
+        """
+        projection = build_projection(self.model, fields) or list(self._columns.values())
+        conditions = self._owned([], user_id)
+        filter_clause = compile_filter(self.model, query_dict)
+        if filter_clause is not None:
+            conditions.append(filter_clause)
+        field_name, descending = self._resolve_sort(sort)
+        if field_name is None:
+            field_name, descending = "id", True
+        column = self._columns[field_name]
+        query = (
+            select(*projection)
+            .where(*conditions)
+            .order_by(column.desc() if descending else column.asc(), self.model.id)
+        )
+
+        try:
+            result = await self.db.stream(query.execution_options(yield_per=chunk_size))
+            async for partition in result.partitions():
+                yield [row._asdict() for row in partition]
+        except Exception as e:
+            logger.error(f"Error exporting {self.entity_name}: {str(e)}")
+            raise
+
+    async def update(self, obj_id: int, update_data: Dict[str, Any], user_id: Optional[str] = None) -> Optional[ModelT]:
+        """Update a record (requires ownership)
+
+        Runs as one ``UPDATE ... WHERE id = :id AND user_id = :uid RETURNING ...``; old values
+        are only read first when the change touches ``tracked_fields``.
+        """
+        try:
+            changes = {key: value for key, value in update_data.items() if key in self._writable}
+            if not changes:
+                return await self.get_by_id(obj_id, user_id=user_id)
+            owned, params = self._id_params(obj_id, user_id)
+            old = None
+            if any(key in self.tracked_fields for key in changes):
+                old = (await self.db.execute(self._tracked_by_id_stmts[owned], params)).one_or_none()
+
+            stmt = self._update_by_id_stmts[owned].values(changes)
+            if self.db.get_bind().dialect.update_returning:
+                # populate_existing refreshes an already loaded instance, including onupdate columns
+                result = await self.db.scalars(
+                    stmt.returning(self.model).execution_options(populate_existing=True), params
+                )
+                obj = result.one_or_none()
+            else:
+                result = await self.db.execute(stmt, params)
+                obj = None
+                if result.rowcount:
+                    result = await self.db.execute(
+                        self._get_by_id_stmts[owned].execution_options(populate_existing=True), params
+                    )
+                    obj = result.scalar_one()
+            if obj is None:
+                logger.warning(f"{self.model.__name__} {obj_id} not found for update")
+                return None
+            if old is not None:
+                self._track_row(old, sign=-1)
+                self._track_row(obj)
+            await self._apply_tracked()
+
+            await commit_or_flush(self.db)
+            logger.info(f"Updated {self.entity_name} {obj_id}")
+            return obj
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error updating {self.entity_name} {obj_id}: {str(e)}")
+            raise
+
+    async def delete(self, obj_id: int, user_id: Optional[str] = None) -> bool:
+        """Delete a record (requires ownership) with one ``DELETE ... RETURNING``"""
+        try:
+            owned, params = self._id_params(obj_id, user_id)
+            stmt = self._delete_by_id_stmts[owned]
+            deleted_columns = [self.model.id] + self._tracked_columns
+            if self.db.get_bind().dialect.delete_returning:
+                row = (await self.db.execute(stmt.returning(*deleted_columns), params)).one_or_none()
+            else:
+                row = (await self.db.execute(select(*deleted_columns).where(stmt.whereclause), params)).one_or_none()
+                if row is not None:
+                    await self.db.execute(stmt, params)
+            if row is None:
+                logger.warning(f"{self.model.__name__} {obj_id} not found for deletion")
+                return False
+            self._track_row(row, sign=-1)
+            await self._apply_tracked()
+            await commit_or_flush(self.db)
+            logger.info(f"Deleted {self.entity_name} {obj_id}")
+            return True
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error deleting {self.entity_name} {obj_id}: {str(e)}")
+            raise
+
+    async def bulk_update(
+        self, items: List[Tuple[int, Dict[str, Any]]], user_id: Optional[str] = None
+    ) -> List[ModelT]:
+        """Update many records set-wise (requires ownership)
+
+        When every item carries the same changes they are applied with one
+        ``UPDATE ... WHERE id IN (...)``; otherwise with one executemany
+        ``UPDATE ... WHERE id = :id AND user_id = :uid`` per set of changed columns and a
+        single reload. Everything commits in a single transaction.
+        """
+        if not items:
+            return []
+        try:
+            merged: Dict[int, Dict[str, Any]] = {}
+            for obj_id, update_data in items:
+                merged.setdefault(obj_id, {}).update(
+                    {key: value for key, value in update_data.items() if key in self._writable}
+                )
+            change_sets = {tuple(sorted(values.items())) for values in merged.values()}
+            if len(change_sets) == 1:
+                updated = await self._bulk_update_shared(list(merged), dict(change_sets.pop()), user_id)
+            else:
+                updated = await self._bulk_update_by_id(merged, user_id)
+
+            await self._apply_tracked()
+            await commit_or_flush(self.db)
+            logger.info(f"Bulk updated {len(updated)} {self.entity_name}s")
+            return [updated[obj_id] for obj_id in merged if obj_id in updated]
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error bulk updating {self.entity_name}s: {str(e)}")
+            raise
+
+    async def _track_old_rows(self, ids: List[int], user_id: Optional[str]) -> None:
+        """Record the current tracked values of ``ids`` as removed (sign=-1) before they change
+
+        Rows are locked like in ``update()``, so concurrent batches cannot both subtract
+        the same old values.
+        """
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            conditions = self._owned([self.model.id.in_(ids[start:start + BULK_CHUNK_SIZE])], user_id)
+            query = select(*self._tracked_columns).where(*conditions).with_for_update()
+            for row in await self.db.execute(query):
+                self._track_row(row, sign=-1)
+
+    async def _bulk_update_shared(
+        self, ids: List[int], values: Dict[str, Any], user_id: Optional[str]
+    ) -> Dict[int, ModelT]:
+        """Apply the same ``values`` to all ``ids`` with one UPDATE ... RETURNING per chunk"""
+        model = self.model
+        returning = self.db.get_bind().dialect.update_returning
+        affects_tracked = any(key in self.tracked_fields for key in values)
+        if affects_tracked:
+            await self._track_old_rows(ids, user_id)
+        updated: Dict[int, ModelT] = {}
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            conditions = self._owned([model.id.in_(ids[start:start + BULK_CHUNK_SIZE])], user_id)
+            if values and returning:
+                stmt = (
+                    update(model).where(*conditions).values(values)
+                    .returning(model)
+                    .execution_options(synchronize_session=False, populate_existing=True)
+                )
+            else:
+                if values:
+                    await self.db.execute(
+                        update(model).where(*conditions).values(values)
+                        .execution_options(synchronize_session=False)
+                    )
+                stmt = select(model).where(*conditions).execution_options(populate_existing=True)
+            for obj in (await self.db.scalars(stmt)).all():
+                updated[obj.id] = obj
+                if affects_tracked:
+                    self._track_row(obj)
+        return updated
+
+    async def _bulk_update_by_id(
+        self, merged: Dict[int, Dict[str, Any]], user_id: Optional[str]
+    ) -> Dict[int, ModelT]:
+        """Apply per-row changes with executemany UPDATEs keyed by id, then reload with one SELECT per chunk"""
+        model = self.model
+        table = model.__table__
+        ids = list(merged)
+        affects_tracked = any(key in self.tracked_fields for values in merged.values() for key in values)
+        if affects_tracked:
+            await self._track_old_rows(ids, user_id)
+
+        # executemany needs the same SET columns on every row; "new_" keeps clear of the SET names UPDATE reserves
+        by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for obj_id, values in merged.items():
+            if not values:
+                continue
+            params = {f"new_{key}": value for key, value in values.items()}
+            params["obj_id"] = obj_id
+            if user_id:
+                params["owner_id"] = user_id
+            by_columns.setdefault(tuple(sorted(values)), []).append(params)
+        for columns, params in by_columns.items():
+            where = [table.c.id == bindparam("obj_id")]
+            if user_id:
+                where.append(table.c.user_id == bindparam("owner_id"))
+            stmt = update(table).where(*where).values({name: bindparam(f"new_{name}") for name in columns})
+            await self.db.execute(stmt, params)
+
+        updated: Dict[int, ModelT] = {}
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            conditions = self._owned([model.id.in_(ids[start:start + BULK_CHUNK_SIZE])], user_id)
+            stmt = select(model).where(*conditions).execution_options(populate_existing=True)
+            for obj in (await self.db.scalars(stmt)).all():
+                updated[obj.id] = obj
+                if affects_tracked:
+                    self._track_row(obj)
+        return updated
+
+    async def bulk_delete(self, ids: List[int], user_id: Optional[str] = None) -> List[int]:
+        """Delete many records with one ``DELETE ... WHERE id IN (...)`` (requires ownership)
+
+        Returns the ids that were actually deleted.
+        """
+        if not ids:
+            return []
+        try:
+            ids = list(dict.fromkeys(ids))
+            model = self.model
+            returning = self.db.get_bind().dialect.delete_returning
+            deleted_columns = [model.id] + self._tracked_columns
+            deleted_ids: List[int] = []
+            for start in range(0, len(ids), BULK_CHUNK_SIZE):
+                conditions = self._owned([model.id.in_(ids[start:start + BULK_CHUNK_SIZE])], user_id)
+                stmt = delete(model).where(*conditions).execution_options(synchronize_session=False)
+                if returning:
+                    rows = (await self.db.execute(stmt.returning(*deleted_columns))).all()
+                else:
+                    rows = (await self.db.execute(select(*deleted_columns).where(*conditions))).all()
+                    await self.db.execute(stmt)
+                for row in rows:
+                    deleted_ids.append(row.id)
+                    self._track_row(row, sign=-1)
+
+            await self._apply_tracked()
+            await commit_or_flush(self.db)
+            logger.info(f"Bulk deleted {len(deleted_ids)} {self.entity_name}s")
+            return deleted_ids
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error bulk deleting {self.entity_name}s: {str(e)}")
+            raise
+
+    async def get_by_field(self, field_name: str, field_value: Any) -> Optional[ModelT]:
+        """Get a record by any field"""
+        try:
+            column = self._field_column(field_name)
+            result = await self.db.execute(select(self.model).where(column == field_value))
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Error fetching {self.entity_name} by {field_name}: {str(e)}")
+            raise
+
+    async def list_by_field(
+        self, field_name: str, field_value: Any, skip: int = 0, limit: int = 20
+    ) -> List[ModelT]:
+        """Get a list of records filtered by field"""
+        try:
+            column = self._field_column(field_name)
+            result = await self.db.execute(
+                select(self.model)
+                .where(column == field_value)
+                .offset(skip)
+                .limit(limit)
+                .order_by(self.model.id.desc())
+            )
+            return result.scalars().all()
+        except Exception as e:
+            logger.error(f"Error fetching {self.entity_name}s by {field_name}: {str(e)}")
+            raise
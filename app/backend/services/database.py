@@ -31,6 +31,9 @@ async def initialize_database():
     if "MGX_IGNORE_INIT_DB" in os.environ:
         logger.info("Ignore creating tables")
         return
+    if db_manager.initialized:
+        logger.debug("[DB_OP] Database already initialized")
+        return
     start_time = time.time()
     logger.debug("[DB_OP] Starting database initialization")
     try:
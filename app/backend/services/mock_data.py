@@ -1,23 +1,39 @@
 import asyncio
+import csv
 import json
 import logging
 import os
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from core.database import db_manager
-from sqlalchemy import Date, DateTime, MetaData, Table, func, select
+from models.transactions import Transactions
+from services.transaction_rollups import TransactionRollupsService
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, MetaData, Numeric, Table, select
 from sqlalchemy.exc import NoSuchTableError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 MOCK_DATA_DIR = Path(__file__).resolve().parent.parent / "mock_data"
 MAX_CONCURRENT_LOADS = 5
 
+# Seed file formats; the file stem names the target table (transactions.ndjson -> transactions)
+SEED_FILE_SUFFIXES = (".json", ".ndjson", ".jsonl", ".csv")
+# Rows buffered per COPY / executemany batch; bounds memory regardless of file size
+SEED_CHUNK_SIZE = 10000
+# Bytes read at a time while streaming a JSON array
+JSON_READ_SIZE = 1 << 16
+
+_JSON_SEPARATORS = " \t\r\n,"
+_TRUE_STRINGS = {"1", "true", "t", "yes", "y"}
+_FALSE_STRINGS = {"0", "false", "f", "no", "n"}
+
 
 async def initialize_mock_data():
-    """Populate tables with mock JSON data when they are empty."""
+    """Populate tables with mock JSON/NDJSON/CSV data when they are empty."""
     if "MGX_IGNORE_INIT_DATA" in os.environ:
         logger.info("Ignore initialize data")
         return
@@ -29,9 +45,9 @@ async def initialize_mock_data():
         logger.info("mock_data directory not found, skipping mock initialization")
         return
 
-    data_files = sorted(MOCK_DATA_DIR.glob("*.json"))
+    data_files = sorted(path for path in MOCK_DATA_DIR.iterdir() if path.suffix in SEED_FILE_SUFFIXES)
     if not data_files:
-        logger.info("No mock JSON files detected; skipping mock initialization")
+        logger.info("No mock data files detected; skipping mock initialization")
         return
 
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOADS)
@@ -46,68 +62,211 @@ async def initialize_mock_data():
     await asyncio.gather(*(load_file(data_file) for data_file in data_files))
 
 
-def _prepare_records(raw_data: Any, table: Table) -> list[dict[str, Any]]:
-    """Filter JSON payload to match the table definition and coerce values."""
-    if isinstance(raw_data, dict):
-        records_iterable: Iterable[dict[str, Any]] = [raw_data]
-    elif isinstance(raw_data, list):
-        records_iterable = [item for item in raw_data if isinstance(item, dict)]
-    else:
-        return []
+# ------------------ Streaming readers ------------------
+def _iter_json_array(data_file: Path) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array (or a lone object) without loading the whole file"""
+    decoder = json.JSONDecoder()
+    with data_file.open("r", encoding="utf-8") as handle:
+        buffer = handle.read(JSON_READ_SIZE).lstrip()
+        if not buffer:
+            return
+        if buffer[0] != "[":
+            # A single object (or scalar) document
+            yield json.loads(buffer + handle.read())
+            return
+
+        position = 1
+        eof = False
+        while True:
+            # Skip whitespace and separators up to the next element
+            while position < len(buffer) and buffer[position] in _JSON_SEPARATORS:
+                position += 1
+            if position < len(buffer) and buffer[position] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                # An element is complete only once the following "," or "]" is buffered;
+                # otherwise a number split across chunks would decode as its prefix
+                following = end
+                while following < len(buffer) and buffer[following] in " \t\r\n":
+                    following += 1
+                if following == len(buffer) or buffer[following] not in ",]":
+                    raise json.JSONDecodeError("Incomplete element", buffer, following)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = handle.read(JSON_READ_SIZE)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield item
+            position = end
 
-    column_map = {column.name: column for column in table.columns}
-    prepared: list[dict[str, Any]] = []
 
-    for entry in records_iterable:
-        filtered = {}
-        for key, value in entry.items():
-            if key not in column_map:
+def _iter_ndjson(data_file: Path) -> Iterator[Any]:
+    with data_file.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
                 continue
-            column = column_map[key]
-            typed_value = _coerce_temporal_value(value, column)
-            filtered[key] = _coerce_value(typed_value, column)
-        if filtered:
-            prepared.append(filtered)
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise json.JSONDecodeError(f"line {line_number}: {exc.msg}", exc.doc, exc.pos) from exc
+
+
+def _iter_csv(data_file: Path) -> Iterator[Dict[str, Any]]:
+    with data_file.open("r", encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            # Empty CSV cells mean NULL so column defaults and nullability behave as in JSON
+            yield {key: (value if value != "" else None) for key, value in row.items()}
+
 
-    return prepared
+def _iter_records(data_file: Path) -> Iterator[Any]:
+    if data_file.suffix == ".csv":
+        return _iter_csv(data_file)
+    if data_file.suffix in (".ndjson", ".jsonl"):
+        return _iter_ndjson(data_file)
+    return _iter_json_array(data_file)
 
 
-def _coerce_temporal_value(value: Any, column) -> Any:
-    """Convert ISO-like strings to Date/DateTime objects when needed."""
-    if value is None or not isinstance(value, str):
+# ------------------ Per-column converters ------------------
+def _parse_date(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
         return value
 
-    column_type = column.type
-    if isinstance(column_type, Date):
+
+def _parse_datetime(value: Any) -> Any:
+    """Convert ISO-like strings to datetime; unparseable values pass through unchanged"""
+    if not isinstance(value, str):
+        return value
+    val_wo_z = value.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(val_wo_z)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(val_wo_z, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return value
+
+
+def _parse_number(parse: Callable[[str], Any]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
         try:
-            return datetime.strptime(value, "%Y-%m-%d").date()
-        except ValueError:
+            return parse(value)
+        except (ValueError, InvalidOperation):
             return value
 
+    return convert
+
+
+def _parse_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    return value
+
+
+def _column_converter(column, json_as_text: bool = False) -> Callable[[Any], Any]:
+    """Build the value converter for ``column`` once, so rows skip per-value type inspection"""
+    column_type = column.type
     if isinstance(column_type, DateTime):
-        val_wo_z = value.replace("Z", "+00:00")
-        for parser in (lambda v: datetime.fromisoformat(v), lambda v: datetime.strptime(v, "%Y-%m-%d %H:%M:%S")):
-            try:
-                return parser(val_wo_z)
-            except ValueError:
-                continue
+        parse = _parse_datetime
+    elif isinstance(column_type, Date):
+        parse = _parse_date
+    elif isinstance(column_type, Boolean):
+        parse = _parse_bool
+    elif isinstance(column_type, Integer):
+        parse = _parse_number(int)
+    elif isinstance(column_type, Float):
+        parse = _parse_number(float)
+    elif isinstance(column_type, Numeric):
+        parse = _parse_number(Decimal)
+    else:
+        parse = None
+
+    is_json = "json" in getattr(column_type, "__visit_name__", "").lower()
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, (dict, list)):
+            # Nested structures become JSON text unless the column (and driver path) takes them as-is
+            if is_json and not json_as_text:
+                return value
+            return json.dumps(value, ensure_ascii=False)
+        if parse is not None:
+            return parse(value)
         return value
 
-    return value
+    return convert
+
+
+def _column_converters(table: Table, json_as_text: bool = False) -> Dict[str, Callable[[Any], Any]]:
+    return {column.name: _column_converter(column, json_as_text) for column in table.columns}
 
 
-def _coerce_value(value: Any, column) -> Any:
-    """Coerce nested structures to JSON strings when the column is not JSON."""
-    if value is None:
+def _prepare_record(entry: Any, converters: Dict[str, Callable[[Any], Any]]) -> Optional[Dict[str, Any]]:
+    """Filter one payload entry to the table's columns and coerce its values."""
+    if not isinstance(entry, dict):
         return None
+    return {key: converters[key](value) for key, value in entry.items() if key in converters} or None
 
-    if isinstance(value, (dict, list)):
-        visit_name = getattr(column.type, "__visit_name__", "").lower()
-        if "json" in visit_name:
-            return value
-        return json.dumps(value, ensure_ascii=False)
 
-    return value
+def _chunks(records: Iterator[Any], converters: Dict[str, Callable[[Any], Any]]) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for entry in records:
+        record = _prepare_record(entry, converters)
+        if record is None:
+            continue
+        chunk.append(record)
+        if len(chunk) >= SEED_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _group_by_columns(chunk: List[Dict[str, Any]]) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    """Split a chunk by key set; records omitting a column must keep getting its default"""
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for record in chunk:
+        groups.setdefault(tuple(record), []).append(record)
+    return groups
+
+
+# ------------------ Writers ------------------
+async def _copy_chunk(conn, table: Table, chunk: List[Dict[str, Any]]) -> None:
+    """Write a chunk with Postgres COPY through the asyncpg connection of ``conn``'s transaction"""
+    raw_connection = await conn.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    for columns, records in _group_by_columns(chunk).items():
+        await driver_connection.copy_records_to_table(
+            table.name,
+            columns=list(columns),
+            records=[tuple(record[column] for column in columns) for record in records],
+            schema_name=table.schema,
+        )
+
+
+async def _insert_chunk(conn, table: Table, chunk: List[Dict[str, Any]]) -> None:
+    for records in _group_by_columns(chunk).values():
+        await conn.execute(table.insert(), records)
+
+
+def _use_copy(conn) -> bool:
+    return conn.dialect.name == "postgresql" and conn.dialect.driver == "asyncpg"
 
 
 async def _reflect_table(conn, table_name: str) -> Table:
@@ -120,38 +279,78 @@ async def _reflect_table(conn, table_name: str) -> Table:
     return await conn.run_sync(_reflect)
 
 
+async def load_seed_file(data_file: Path, table_name: Optional[str] = None, only_if_empty: bool = True) -> int:
+    """Stream ``data_file`` into ``table_name`` (default: the file stem) and return the rows written
+
+    JSON arrays, NDJSON/JSONL and CSV (with a header row) are read incrementally and
+    written in chunks of SEED_CHUNK_SIZE rows: COPY on Postgres/asyncpg, executemany
+    elsewhere. The whole file loads in one transaction. With ``only_if_empty`` the
+    load is skipped (returning 0) when the table already has rows. Loads into
+    transactions also rebuild transaction_daily_rollups in that transaction, since
+    these writes bypass TransactionsService. Raises NoSuchTableError,
+    json.JSONDecodeError and SQLAlchemyError.
+    """
+    table_name = table_name or data_file.stem
+    async with db_manager.engine.begin() as conn:
+        table = await _reflect_table(conn, table_name)
+
+        if only_if_empty and await conn.scalar(select(1).select_from(table).limit(1)) is not None:
+            logger.info("Table %s already has rows; skipping load of %s", table_name, data_file.name)
+            return 0
+
+        use_copy = _use_copy(conn)
+        converters = _column_converters(table, json_as_text=use_copy)
+        write_chunk = _copy_chunk if use_copy else _insert_chunk
+
+        total = 0
+        for chunk in _chunks(_iter_records(data_file), converters):
+            await write_chunk(conn, table, chunk)
+            total += len(chunk)
+            logger.debug("Loaded %d rows into %s", total, table_name)
+
+        if total and table_name == Transactions.__tablename__:
+            # Bound to the load's connection, so the rebuild commits or rolls back together with the rows
+            async with AsyncSession(bind=conn) as session:
+                await TransactionRollupsService(session).rebuild()
+        return total
+
+
 async def _load_table_from_file(data_file: Path):
     table_name = data_file.stem
     logger.info("Processing mock data file %s for table %s", data_file.name, table_name)
 
-    async with db_manager.engine.begin() as conn:
-        try:
-            table = await _reflect_table(conn, table_name)
-        except NoSuchTableError:
-            logger.warning("Table %s does not exist; skipping %s", table_name, data_file.name)
-            return
-        except SQLAlchemyError as exc:
-            logger.error("Failed to reflect table %s: %s", table_name, exc)
-            return
+    try:
+        inserted = await load_seed_file(data_file, table_name)
+    except NoSuchTableError:
+        logger.warning("Table %s does not exist; skipping %s", table_name, data_file.name)
+        return
+    except (json.JSONDecodeError, UnicodeDecodeError, csv.Error) as exc:
+        logger.error("Invalid data in %s: %s", data_file.name, exc)
+        return
+    except SQLAlchemyError as exc:
+        logger.error("Failed to insert mock data into %s: %s", table_name, exc)
+        return
 
-        row_count = await conn.scalar(select(func.count()).select_from(table))
-        if row_count and row_count > 0:
-            logger.info("Table %s already has %d rows; skipping mock insert", table_name, row_count)
-            return
+    if inserted:
+        logger.info("Inserted %d mock records into %s", inserted, table_name)
 
-        try:
-            raw_records = json.loads(data_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            logger.error("Invalid JSON in %s: %s", data_file.name, exc)
-            return
 
-        records = _prepare_records(raw_records, table)
-        if not records:
-            logger.warning("No valid records found in %s after preparing data", data_file.name)
-            return
+async def _load_seed_files(paths: List[str], only_if_empty: bool) -> None:
+    await db_manager.init_db()
+    try:
+        for path in paths:
+            data_file = Path(path)
+            inserted = await load_seed_file(data_file, only_if_empty=only_if_empty)
+            print(f"{data_file.name}: loaded {inserted} rows into {data_file.stem}")
+    finally:
+        await db_manager.close_db()
 
-        try:
-            await conn.execute(table.insert(), records)
-            logger.info("Inserted %d mock records into %s", len(records), table_name)
-        except SQLAlchemyError as exc:
-            logger.error("Failed to insert mock data into %s: %s", table_name, exc)
+
+if __name__ == "__main__":
+    # python -m services.mock_data [--force] <file> [<file> ...]
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    args = sys.argv[1:]
+    force = "--force" in args
+    asyncio.run(_load_seed_files([arg for arg in args if arg != "--force"], only_if_empty=not force))
@@ -1,6 +1,8 @@
 import logging
+import time
+from collections import OrderedDict
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Dict, Literal, Optional, Tuple
+from typing import Any, Dict, Hashable, Literal, Optional, Tuple
 
 import stripe
 from core.config import settings
@@ -201,6 +203,54 @@ async def initialize_stripe():
         )
 
 
+class CheckoutStatusCache:
+    """LRU of checkout statuses served to polling clients
+
+    Open checkouts expire ``ttl`` seconds after caching; terminal ones (paid, expired,
+    failed) cannot change and stay until evicted. Webhook receipt invalidates the
+    checkout's entries, so a payment is reported before the TTL runs out.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any, terminal: bool = False) -> None:
+        self._entries[key] = (None if terminal else time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+checkout_status_cache = CheckoutStatusCache(settings.checkout_status_cache_size, settings.checkout_status_cache_ttl)
+
+
+def _is_terminal_session(status: Optional[str], payment_status: Optional[str]) -> bool:
+    """Whether a Stripe Checkout Session can no longer change state"""
+    return status == "expired" or (status == "complete" and payment_status in ("paid", "no_payment_required"))
+
+
 class PaymentService:
     """Payment service class, handles Stripe integration"""
 
@@ -317,6 +367,9 @@ class PaymentService:
         """
         Retrieves the status of a Stripe checkout session.
 
+        Served from ``checkout_status_cache`` while fresh: open sessions for a few
+        seconds, completed or expired ones until evicted or a webhook arrives.
+
         Args:
             checkout_session_id (str): The ID of the checkout session to check.
 
@@ -326,19 +379,28 @@ class PaymentService:
         Raises:
             CheckoutError: If there"s an error retrieving the session status.
         """
+        # Success pages poll this; serve repeats locally instead of spending Stripe rate limit
+        cached = checkout_status_cache.get(checkout_session_id)
+        if cached is not None:
+            return cached
+
         try:
             # Ensure stripe config is loaded
             await self._auto_reload_stripe_config()
 
             session = await stripe.checkout.Session.retrieve_async(checkout_session_id)
 
-            return CheckoutStatusResponse(
+            status = CheckoutStatusResponse(
                 status=session.status,
                 payment_status=session.payment_status,
                 amount_total=session.amount_total,
                 currency=session.currency,
                 metadata=session.metadata,
             )
+            checkout_status_cache.put(
+                checkout_session_id, status, terminal=_is_terminal_session(session.status, session.payment_status)
+            )
+            return status
 
         except stripe.error.StripeError as e:
             error_type, is_retryable, fixable, fix_suggestion = _classify_stripe_error(e)
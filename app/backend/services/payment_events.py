@@ -0,0 +1,349 @@
+import asyncio
+import json
+import logging
+import os
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set
+
+from core.config import settings
+from core.database import UNIT_OF_WORK_KEY, commit_or_flush, db_manager
+from models.payment_events import Payment_events
+from models.transactions import Transactions
+from services.base import EntityService
+from services.payment_webhooks import transaction_changes
+from services.transactions import TransactionsService
+from sqlalchemy import Row, and_, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+# Transaction states a later (re-ordered) delivery must not move back to pending
+TERMINAL_TRANSACTION_STATUSES = frozenset({"success", "failed", "expired"})
+
+
+# ------------------ Service Layer ------------------
+class Payment_eventsService(EntityService[Payment_events]):
+    """Service layer for Payment_events operations"""
+
+    model = Payment_events
+
+    async def record(
+        self,
+        provider: str,
+        payload: str,
+        event_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        external_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> Optional[Payment_events]:
+        """Append a received delivery with a single INSERT ... RETURNING
+
+        Returns None, without raising, when (provider, event_id) is already stored: on
+        Postgres/SQLite through ON CONFLICT DO NOTHING, elsewhere by catching the
+        unique violation.
+        """
+        row = {
+            "provider": provider,
+            "event_id": event_id,
+            "event_type": event_type,
+            "external_id": external_id,
+            "user_id": user_id,
+            "payload": payload,
+            "status": "received",
+            "attempts": 0,
+            "received_at": datetime.now(timezone.utc),
+        }
+        dialect = self.db.get_bind().dialect
+        if event_id is None or dialect.name not in ("postgresql", "sqlite") or not dialect.insert_returning:
+            try:
+                return await self.create(row)
+            except IntegrityError:
+                logger.info(f"Duplicate {provider} event {event_id} dropped")
+                return None
+
+        if dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = (
+            dialect_insert(Payment_events)
+            .values(row)
+            .on_conflict_do_nothing(index_elements=["provider", "event_id"])
+            .returning(Payment_events)
+        )
+        event = (await self.db.scalars(stmt)).one_or_none()
+        await commit_or_flush(self.db)
+        if event is None:
+            logger.info(f"Duplicate {provider} event {event_id} dropped")
+        return event
+
+    @staticmethod
+    def _claimable(now: datetime, max_attempts: int):
+        """Events a worker may claim: received, failed and due for retry, or processing with an expired claim"""
+        due = or_(Payment_events.next_attempt_at.is_(None), Payment_events.next_attempt_at <= now)
+        return and_(
+            Payment_events.attempts < max_attempts,
+            or_(
+                Payment_events.status == "received",
+                and_(Payment_events.status.in_(("failed", "processing")), due),
+            ),
+        )
+
+    async def pending(self, max_attempts: int) -> Sequence[Row]:
+        """(id, external_id) of events that can be claimed now, in arrival order"""
+        result = await self.db.execute(
+            select(Payment_events.id, Payment_events.external_id)
+            .where(self._claimable(datetime.now(timezone.utc), max_attempts))
+            .order_by(Payment_events.id)
+        )
+        return result.all()
+
+    async def claim(self, event_id: int, max_attempts: int, timeout: int) -> Optional[Row]:
+        """Atomically move a claimable event to processing and commit
+
+        A single conditional UPDATE, so of concurrent workers (in this or another process)
+        exactly one wins. Returns (provider, payload, user_id, attempts) of the claimed
+        event, or None when it does not exist or is not claimable. The claim expires after
+        ``timeout`` seconds, after which a crashed worker's event can be claimed again.
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            update(Payment_events)
+            .where(Payment_events.id == event_id, self._claimable(now, max_attempts))
+            .values(
+                status="processing",
+                attempts=Payment_events.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=timeout),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        columns = (Payment_events.provider, Payment_events.payload, Payment_events.user_id, Payment_events.attempts)
+        if self.db.get_bind().dialect.update_returning:
+            claimed = (await self.db.execute(stmt.returning(*columns))).one_or_none()
+        else:
+            claimed = None
+            if (await self.db.execute(stmt)).rowcount:
+                claimed = (await self.db.execute(select(*columns).where(Payment_events.id == event_id))).one()
+        await self.db.commit()
+        return claimed
+
+    async def finish(self, event_id: int, attempts: int, values: Dict[str, Any]) -> bool:
+        """Record the outcome of the claim numbered ``attempts``; False if it was taken over since (does not commit)"""
+        result = await self.db.execute(
+            update(Payment_events)
+            .where(
+                Payment_events.id == event_id,
+                Payment_events.status == "processing",
+                Payment_events.attempts == attempts,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)
+
+
+async def _apply_to_transaction(db, changes: Dict[str, Any]) -> str:
+    """Upsert the transaction with ``changes['external_id']``; returns the resulting event status
+
+    external_id is only unique per merchant, so the row is looked up under the owner from
+    the checkout metadata. Without an owner, an existing row is only updated when exactly
+    one merchant uses that external_id.
+    """
+    transactions = TransactionsService(db)
+    owner = changes.pop("user_id", None)
+    query = select(Transactions).where(Transactions.external_id == changes["external_id"])
+    if owner:
+        query = query.where(Transactions.user_id == owner)
+    # Row lock serializes events for one transaction across workers and processes
+    matches = (await db.scalars(query.limit(2).with_for_update())).all()
+    if len(matches) > 1:
+        raise ValueError(f"external_id {changes['external_id']} is used by several merchants and no owner in metadata")
+    existing = matches[0] if matches else None
+    if existing is not None:
+        if existing.status in TERMINAL_TRANSACTION_STATUSES and changes["status"] not in TERMINAL_TRANSACTION_STATUSES:
+            return "ignored"
+        # Goes through the service so transaction_daily_rollups follow the status change
+        await transactions.update(existing.id, changes, user_id=existing.user_id)
+        return "processed"
+    if not owner:
+        raise ValueError(f"No transaction with external_id {changes['external_id']} and no owner in metadata")
+    await transactions.create(changes, user_id=owner)
+    return "processed"
+
+
+async def process_payment_event(event_id: int) -> Optional[str]:
+    """Claim one stored event and apply it to transactions; returns its new status
+
+    Returns None when the event does not exist or is not claimable (already done, held
+    by another worker, out of attempts or waiting for its retry). The transaction upsert
+    and the event's final status commit together. On error the event is marked failed
+    and becomes due again after PAYMENT_EVENT_RETRY_DELAY seconds, doubled per attempt.
+    """
+    await db_manager.ensure_initialized()
+    async with db_manager.async_session_maker() as db:
+        db.info[UNIT_OF_WORK_KEY] = True
+        events = Payment_eventsService(db)
+        claimed = await events.claim(
+            event_id, settings.payment_event_max_attempts, settings.payment_event_claim_timeout
+        )
+        if claimed is None:
+            return None
+        try:
+            changes = transaction_changes(claimed.provider, json.loads(claimed.payload))
+            if changes is not None and claimed.user_id:
+                # Verified with this merchant's own webhook secret, which outranks checkout metadata
+                changes["user_id"] = claimed.user_id
+            status = "ignored" if changes is None else await _apply_to_transaction(db, changes)
+            outcome = {"status": status, "error": None, "processed_at": datetime.now(timezone.utc)}
+            if not await events.finish(event_id, claimed.attempts, {**outcome, "next_attempt_at": None}):
+                raise RuntimeError("claim expired and was taken over by another worker")
+            await db.commit()
+            return status
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Failed to process payment event {event_id}: {str(e)}")
+            delay = settings.payment_event_retry_delay * 2 ** (claimed.attempts - 1)
+            await events.finish(
+                event_id,
+                claimed.attempts,
+                {
+                    "status": "failed",
+                    "error": str(e)[:500],
+                    "next_attempt_at": datetime.now(timezone.utc) + timedelta(seconds=delay),
+                },
+            )
+            await db.commit()
+            return "failed"
+
+
+class RecentEvents:
+    """Bounded LRU set of recently stored (provider, event_id) keys
+
+    Exact membership, unlike a bloom filter, so a hit can safely skip the database;
+    misses fall through to the unique index on payment_events.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        if key not in self._keys:
+            return False
+        self._keys.move_to_end(key)
+        return True
+
+    def add(self, key: Hashable) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+recent_payment_events = RecentEvents(settings.payment_event_dedup_cache_size)
+
+
+class PaymentEventWorker:
+    """Processes stored webhook events on a pool of asyncio tasks
+
+    Events are sharded by external_id, so deliveries for one transaction are applied
+    in order by a single task while different transactions proceed in parallel. A
+    sweeper queues claimable events (the backlog from before startup, failed events
+    due for retry, expired claims) every PAYMENT_EVENT_SWEEP_INTERVAL seconds. Events
+    are claimed atomically, so several processes can run workers side by side.
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = max(1, concurrency)
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+        self._sweeper: Optional[asyncio.Task] = None
+        self._queued: Set[int] = set()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queues = [asyncio.Queue() for _ in range(self.concurrency)]
+        self._tasks = [asyncio.create_task(self._run(queue)) for queue in self._queues]
+        self._sweeper = asyncio.create_task(self._sweep())
+        logger.info(f"Payment event worker started with {self.concurrency} tasks")
+
+    def submit(self, event_id: int, external_id: Optional[str] = None) -> bool:
+        """Queue an event unless it already is; returns False when the worker is not running"""
+        if not self.running:
+            return False
+        if event_id in self._queued:
+            return True
+        self._queued.add(event_id)
+        shard = zlib.crc32((external_id or str(event_id)).encode()) % self.concurrency
+        self._queues[shard].put_nowait(event_id)
+        return True
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Finish queued events (up to ``timeout`` seconds), then stop; leftovers are swept up on next start"""
+        if not self.running:
+            return
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        for queue in self._queues:
+            queue.put_nowait(None)
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        self._tasks = []
+        self._queues = []
+        self._queued.clear()
+
+    async def sweep(self) -> int:
+        """Queue every event that can be claimed now; returns how many were found"""
+        async with db_manager.async_session_maker() as db:
+            due = await Payment_eventsService(db).pending(settings.payment_event_max_attempts)
+        for event_id, external_id in due:
+            self.submit(event_id, external_id)
+        return len(due)
+
+    async def _sweep(self) -> None:
+        while True:
+            try:
+                count = await self.sweep()
+                if count:
+                    logger.info(f"Payment event sweep queued {count} events")
+            except Exception as e:
+                logger.error(f"Payment event sweep failed: {str(e)}", exc_info=True)
+            await asyncio.sleep(settings.payment_event_sweep_interval)
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            event_id = await queue.get()
+            if event_id is None:
+                return
+            self._queued.discard(event_id)
+            try:
+                await process_payment_event(event_id)
+            except Exception as e:
+                logger.error(f"Payment event worker error on event {event_id}: {str(e)}", exc_info=True)
+
+
+payment_event_worker = PaymentEventWorker(settings.payment_event_workers)
+
+
+async def start_payment_event_worker():
+    if "MGX_IGNORE_INIT_DB" in os.environ or not db_manager.async_session_maker:
+        logger.info("Database not initialized; payment events will be processed per request")
+        return
+    await payment_event_worker.start()
+
+
+async def stop_payment_event_worker():
+    await payment_event_worker.stop()
@@ -0,0 +1,318 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Optional, Tuple
+
+import stripe
+from core.config import settings
+from models.payment_settings import Payment_settings
+from pydantic import BaseModel, Field, field_validator
+from services.payment import CheckoutError, _classify_stripe_error, checkout_status_cache
+from services.xendit_payment import XenditInvoiceRequest, XenditPaymentService
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Provider-independent checkout states; the terminal ones never change again
+CHECKOUT_STATUSES = ("pending", "paid", "expired", "failed")
+TERMINAL_CHECKOUT_STATUSES = frozenset({"paid", "expired", "failed"})
+
+
+class GatewayCheckoutRequest(BaseModel):
+    """Provider-independent request for a hosted checkout."""
+
+    amount: Decimal = Field(..., description="The amount to charge in the specified currency")
+    currency: str = Field(..., description="The currency code")
+    reference_id: str = Field(..., description="Merchant reference (order ID); becomes the transaction external_id")
+    description: Optional[str] = Field(None, description="What the payer is buying")
+    success_url: Optional[str] = Field(None, description="URL to redirect after success")
+    cancel_url: Optional[str] = Field(None, description="URL to redirect if payment is cancelled or fails")
+    customer_email: Optional[str] = Field(None, description="Payer email")
+    metadata: Optional[Dict[str, str]] = Field(None, description="Additional metadata to store with the checkout")
+    idempotency_key: Optional[str] = Field(None, description="Idempotency key to avoid duplicate checkouts")
+
+    @field_validator("amount")
+    @classmethod
+    def validate_amount(cls, v):
+        if v <= 0:
+            raise ValueError("Amount must be greater than 0")
+        return v
+
+
+class GatewayCheckoutResponse(BaseModel):
+    """Response model for a created checkout."""
+
+    provider: str = Field(..., description="Payment provider that owns the checkout")
+    checkout_id: str = Field(..., description="Provider ID of the checkout (Stripe session / Xendit invoice)")
+    url: Optional[str] = Field(None, description="Hosted payment page to send the payer to")
+
+
+class GatewayCheckoutStatus(BaseModel):
+    """Provider-independent checkout status."""
+
+    provider: str = Field(..., description="Payment provider that owns the checkout")
+    checkout_id: str = Field(..., description="Provider ID of the checkout")
+    status: str = Field(..., description="One of pending, paid, expired, failed")
+    provider_status: str = Field(..., description="Status as reported by the provider")
+    amount: Decimal = Field(..., description="The checkout amount in the specified currency")
+    currency: str = Field(..., description="The currency code")
+    reference_id: Optional[str] = Field(None, description="Merchant reference passed at creation")
+    metadata: Dict[str, str] = Field(default_factory=dict, description="The metadata of the checkout")
+
+
+class PaymentGateway(ABC):
+    """A payment provider configured with one merchant's credentials"""
+
+    provider: str = ""
+
+    @abstractmethod
+    async def create_checkout(self, request: GatewayCheckoutRequest) -> GatewayCheckoutResponse:
+        """Create a hosted checkout; raises CheckoutError"""
+
+    @abstractmethod
+    async def get_checkout_status(self, checkout_id: str) -> GatewayCheckoutStatus:
+        """Look up a checkout's current status; raises CheckoutError"""
+
+
+class StripeGateway(PaymentGateway):
+    """Stripe Checkout through a per-merchant StripeClient (no process-global ``stripe.api_key``)"""
+
+    provider = "stripe"
+
+    def __init__(self, secret_key: str):
+        self.client = stripe.StripeClient(secret_key)
+
+    @staticmethod
+    def _raise(action: str, e: Exception):
+        if isinstance(e, stripe.error.StripeError):
+            error_type, is_retryable, fixable, fix_suggestion = _classify_stripe_error(e)
+            raise CheckoutError(
+                f"Failed to {action}: {str(e)}",
+                error_type=error_type,
+                is_retryable=is_retryable,
+                fixable=fixable,
+                fix_suggestion=fix_suggestion,
+                original_error=e,
+            )
+        raise CheckoutError(
+            f"Unexpected error trying to {action}: {str(e)}",
+            error_type="unexpected",
+            fix_suggestion="Check application logs and request parameters",
+            original_error=e,
+        )
+
+    async def create_checkout(self, request: GatewayCheckoutRequest) -> GatewayCheckoutResponse:
+        amount_in_cents = int((request.amount * Decimal("100")).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+        params = {
+            "mode": "payment",
+            "line_items": [
+                {
+                    "price_data": {
+                        "currency": request.currency.lower(),
+                        "product_data": {"name": request.description or "Payment"},
+                        "unit_amount": amount_in_cents,
+                    },
+                    "quantity": 1,
+                }
+            ],
+            "success_url": request.success_url,
+            "cancel_url": request.cancel_url,
+            "client_reference_id": request.reference_id,
+            "metadata": request.metadata or {},
+        }
+        if request.customer_email:
+            params["customer_email"] = request.customer_email
+        options = {"idempotency_key": request.idempotency_key} if request.idempotency_key else None
+        try:
+            session = await self.client.v1.checkout.sessions.create_async(params=params, options=options)
+        except Exception as e:
+            self._raise("create checkout session", e)
+        return GatewayCheckoutResponse(provider=self.provider, checkout_id=session.id, url=session.url)
+
+    async def get_checkout_status(self, checkout_id: str) -> GatewayCheckoutStatus:
+        try:
+            session = await self.client.v1.checkout.sessions.retrieve_async(checkout_id)
+        except Exception as e:
+            self._raise(f"retrieve session status for session_id={checkout_id}", e)
+        if session.status == "expired":
+            status = "expired"
+        elif session.status == "complete" and session.payment_status in ("paid", "no_payment_required"):
+            status = "paid"
+        else:
+            # open, or complete while an asynchronous payment method is still processing
+            status = "pending"
+        return GatewayCheckoutStatus(
+            provider=self.provider,
+            checkout_id=session.id,
+            status=status,
+            provider_status=f"{session.status}/{session.payment_status}",
+            amount=Decimal(session.amount_total or 0) / 100,
+            currency=session.currency or "",
+            reference_id=session.client_reference_id,
+            metadata=dict(session.metadata or {}),
+        )
+
+
+class XenditGateway(PaymentGateway):
+    """Xendit invoices (hosted payment page) through XenditPaymentService"""
+
+    provider = "xendit"
+
+    _STATUSES = {"PENDING": "pending", "PAID": "paid", "SETTLED": "paid", "EXPIRED": "expired"}
+
+    def __init__(self, secret_key: str):
+        self.service = XenditPaymentService(api_key=secret_key)
+
+    async def create_checkout(self, request: GatewayCheckoutRequest) -> GatewayCheckoutResponse:
+        invoice = await self.service.create_invoice(
+            XenditInvoiceRequest(
+                external_id=request.reference_id,
+                amount=request.amount,
+                currency=request.currency.upper(),
+                description=request.description,
+                payer_email=request.customer_email,
+                success_redirect_url=request.success_url,
+                failure_redirect_url=request.cancel_url,
+                metadata=request.metadata,
+            )
+        )
+        return GatewayCheckoutResponse(provider=self.provider, checkout_id=invoice.id, url=invoice.invoice_url)
+
+    async def get_checkout_status(self, checkout_id: str) -> GatewayCheckoutStatus:
+        invoice = await self.service.get_invoice(checkout_id)
+        return GatewayCheckoutStatus(
+            provider=self.provider,
+            checkout_id=invoice.id,
+            status=self._STATUSES.get(invoice.status, "pending"),
+            provider_status=invoice.status,
+            amount=invoice.amount,
+            currency=invoice.currency,
+            reference_id=invoice.external_id,
+            metadata={key: str(value) for key, value in (invoice.metadata or {}).items()},
+        )
+
+
+# Gateway classes by payment_settings.provider
+GATEWAYS = {gateway.provider: gateway for gateway in (StripeGateway, XenditGateway)}
+
+GatewayKey = Tuple[str, str, Optional[str]]
+
+
+class GatewayCache:
+    """LRU of configured gateways keyed by (user_id, provider, environment)
+
+    Entries also expire ``ttl`` seconds after loading, which bounds staleness in
+    other worker processes; this process evicts them as soon as settings change.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[GatewayKey, Tuple[float, PaymentGateway]]" = OrderedDict()
+
+    def get(self, key: GatewayKey) -> Optional[PaymentGateway]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, gateway = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return gateway
+
+    def put(self, key: GatewayKey, gateway: PaymentGateway) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, gateway)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str, provider: Optional[str] = None) -> None:
+        """Drop every cached environment of ``user_id`` (optionally only one provider)"""
+        for key in [key for key in self._entries if key[0] == user_id and provider in (None, key[1])]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+gateway_cache = GatewayCache(settings.payment_gateway_cache_size, settings.payment_gateway_cache_ttl)
+
+
+async def get_payment_gateway(
+    db: AsyncSession, user_id: str, provider: str, environment: Optional[str] = None
+) -> PaymentGateway:
+    """Return the gateway configured by ``user_id``'s payment_settings for ``provider``
+
+    Served from ``gateway_cache`` when possible, so steady checkout traffic neither
+    queries payment_settings nor rebuilds provider clients. Without ``environment``
+    the newest active setting of that provider is used. Raises CheckoutError when
+    the provider is unsupported or no active setting with a secret key exists.
+    """
+    key = (user_id, provider, environment)
+    gateway = gateway_cache.get(key)
+    if gateway is not None:
+        return gateway
+
+    gateway_class = GATEWAYS.get(provider)
+    if gateway_class is None:
+        raise CheckoutError(
+            f"Unsupported payment provider: {provider}",
+            error_type="validation",
+            fixable=True,
+            fix_suggestion=f"Use one of: {', '.join(GATEWAYS)}",
+        )
+
+    query = select(Payment_settings.secret_key).where(
+        Payment_settings.user_id == user_id,
+        Payment_settings.provider == provider,
+        or_(Payment_settings.is_active.is_(None), Payment_settings.is_active.is_(True)),
+    )
+    if environment is not None:
+        query = query.where(Payment_settings.environment == environment)
+    secret_key = (await db.execute(query.order_by(Payment_settings.id.desc()).limit(1))).scalar()
+    if not secret_key:
+        raise CheckoutError(
+            f"No active {provider} payment settings with a secret key for this account",
+            error_type="authentication",
+            fixable=True,
+            fix_suggestion=f"Add or activate {provider} credentials in payment settings",
+        )
+
+    gateway = gateway_class(secret_key)
+    gateway_cache.put(key, gateway)
+    logger.debug(f"Configured {provider} gateway for user {user_id} ({environment or 'any environment'})")
+    return gateway
+
+
+async def lookup_checkout_status(
+    db: AsyncSession, user_id: str, provider: str, checkout_id: str, environment: Optional[str] = None
+) -> GatewayCheckoutStatus:
+    """Status of ``checkout_id`` as seen with ``user_id``'s credentials, through ``checkout_status_cache``
+
+    Entries are per user, so a cached status is only served to the merchant whose
+    credentials fetched it. Raises CheckoutError like ``get_checkout_status``.
+    """
+    key = (provider, checkout_id, user_id)
+    status = checkout_status_cache.get(key)
+    if status is not None:
+        return status
+    gateway = await get_payment_gateway(db, user_id, provider, environment)
+    status = await gateway.get_checkout_status(checkout_id)
+    checkout_status_cache.put(key, status, terminal=status.status in TERMINAL_CHECKOUT_STATUSES)
+    return status
+
+
+def invalidate_checkout_status(provider: str, checkout_id: str, user_id: Optional[str] = None) -> None:
+    """Drop cached statuses of a checkout, e.g. when a webhook reports it changed"""
+    if user_id:
+        checkout_status_cache.invalidate((provider, checkout_id, user_id))
+    if provider == "stripe":
+        # PaymentService caches platform-account sessions by bare session ID
+        checkout_status_cache.invalidate(checkout_id)
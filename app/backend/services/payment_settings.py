@@ -1,172 +1,38 @@
-import logging
-from typing import Optional, Dict, Any, List
-
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Set, Tuple
 
 from models.payment_settings import Payment_settings
-
-logger = logging.getLogger(__name__)
-
+from services.base import EntityService
+from services.payment_gateway import gateway_cache
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # ------------------ Service Layer ------------------
-class Payment_settingsService:
-    """Service layer for Payment_settings operations"""
-
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class Payment_settingsService(EntityService[Payment_settings]):
+    """Service layer for Payment_settings operations
 
-    async def create(self, data: Dict[str, Any], user_id: Optional[str] = None) -> Optional[Payment_settings]:
-        """Create a new payment_settings"""
-        try:
-            if user_id:
-                data['user_id'] = user_id
-            obj = Payment_settings(**data)
-            self.db.add(obj)
-            await self.db.commit()
-            await self.db.refresh(obj)
-            logger.info(f"Created payment_settings with id: {obj.id}")
-            return obj
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Error creating payment_settings: {str(e)}")
-            raise
+    Writes evict the affected users' gateways from services.payment_gateway.gateway_cache.
+    """
 
-    async def check_ownership(self, obj_id: int, user_id: str) -> bool:
-        """Check if user owns this record"""
-        try:
-            obj = await self.get_by_id(obj_id, user_id=user_id)
-            return obj is not None
-        except Exception as e:
-            logger.error(f"Error checking ownership for payment_settings {obj_id}: {str(e)}")
-            return False
+    model = Payment_settings
+    tracked_fields = ("user_id", "provider", "environment", "public_key", "secret_key", "is_active")
 
-    async def get_by_id(self, obj_id: int, user_id: Optional[str] = None) -> Optional[Payment_settings]:
-        """Get payment_settings by ID (user can only see their own records)"""
-        try:
-            query = select(Payment_settings).where(Payment_settings.id == obj_id)
-            if user_id:
-                query = query.where(Payment_settings.user_id == user_id)
-            result = await self.db.execute(query)
-            return result.scalar_one_or_none()
-        except Exception as e:
-            logger.error(f"Error fetching payment_settings {obj_id}: {str(e)}")
-            raise
-
-    async def get_list(
-        self, 
-        skip: int = 0, 
-        limit: int = 20, 
-        user_id: Optional[str] = None,
-        query_dict: Optional[Dict[str, Any]] = None,
-        sort: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get paginated list of payment_settingss (user can only see their own records)"""
-        try:
-            query = select(Payment_settings)
-            count_query = select(func.count(Payment_settings.id))
-            
-            if user_id:
-                query = query.where(Payment_settings.user_id == user_id)
-                count_query = count_query.where(Payment_settings.user_id == user_id)
-            
-            if query_dict:
-                for field, value in query_dict.items():
-                    if hasattr(Payment_settings, field):
-                        query = query.where(getattr(Payment_settings, field) == value)
-                        count_query = count_query.where(getattr(Payment_settings, field) == value)
-            
-            count_result = await self.db.execute(count_query)
-            total = count_result.scalar()
-
-            if sort:
-                if sort.startswith('-'):
-                    field_name = sort[1:]
-                    if hasattr(Payment_settings, field_name):
-                        query = query.order_by(getattr(Payment_settings, field_name).desc())
-                else:
-                    if hasattr(Payment_settings, sort):
-                        query = query.order_by(getattr(Payment_settings, sort))
-            else:
-                query = query.order_by(Payment_settings.id.desc())
-
-            result = await self.db.execute(query.offset(skip).limit(limit))
-            items = result.scalars().all()
-
-            return {
-                "items": items,
-                "total": total,
-                "skip": skip,
-                "limit": limit,
-            }
-        except Exception as e:
-            logger.error(f"Error fetching payment_settings list: {str(e)}")
-            raise
-
-    async def update(self, obj_id: int, update_data: Dict[str, Any], user_id: Optional[str] = None) -> Optional[Payment_settings]:
-        """Update payment_settings (requires ownership)"""
-        try:
-            obj = await self.get_by_id(obj_id, user_id=user_id)
-            if not obj:
-                logger.warning(f"Payment_settings {obj_id} not found for update")
-                return None
-            for key, value in update_data.items():
-                if hasattr(obj, key) and key != 'user_id':
-                    setattr(obj, key, value)
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self._touched: Set[Tuple[str, str]] = set()
 
-            await self.db.commit()
-            await self.db.refresh(obj)
-            logger.info(f"Updated payment_settings {obj_id}")
-            return obj
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Error updating payment_settings {obj_id}: {str(e)}")
-            raise
+    def _track_row(self, row: Any, sign: int = 1) -> None:
+        self._touched.add((row.user_id, row.provider))
 
-    async def delete(self, obj_id: int, user_id: Optional[str] = None) -> bool:
-        """Delete payment_settings (requires ownership)"""
-        try:
-            obj = await self.get_by_id(obj_id, user_id=user_id)
-            if not obj:
-                logger.warning(f"Payment_settings {obj_id} not found for deletion")
-                return False
-            await self.db.delete(obj)
-            await self.db.commit()
-            logger.info(f"Deleted payment_settings {obj_id}")
-            return True
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Error deleting payment_settings {obj_id}: {str(e)}")
-            raise
+    async def _apply_tracked(self) -> None:
+        touched, self._touched = self._touched, set()
+        if not touched:
+            return
 
-    async def get_by_field(self, field_name: str, field_value: Any) -> Optional[Payment_settings]:
-        """Get payment_settings by any field"""
-        try:
-            if not hasattr(Payment_settings, field_name):
-                raise ValueError(f"Field {field_name} does not exist on Payment_settings")
-            result = await self.db.execute(
-                select(Payment_settings).where(getattr(Payment_settings, field_name) == field_value)
-            )
-            return result.scalar_one_or_none()
-        except Exception as e:
-            logger.error(f"Error fetching payment_settings by {field_name}: {str(e)}")
-            raise
+        def evict(*args):
+            for user_id, provider in touched:
+                gateway_cache.invalidate(user_id, provider)
 
-    async def list_by_field(
-        self, field_name: str, field_value: Any, skip: int = 0, limit: int = 20
-    ) -> List[Payment_settings]:
-        """Get list of payment_settingss filtered by field"""
-        try:
-            if not hasattr(Payment_settings, field_name):
-                raise ValueError(f"Field {field_name} does not exist on Payment_settings")
-            result = await self.db.execute(
-                select(Payment_settings)
-                .where(getattr(Payment_settings, field_name) == field_value)
-                .offset(skip)
-                .limit(limit)
-                .order_by(Payment_settings.id.desc())
-            )
-            return result.scalars().all()
-        except Exception as e:
-            logger.error(f"Error fetching payment_settingss by {field_name}: {str(e)}")
-            raise
\ No newline at end of file
+        evict()
+        # Evict again once the change is committed, in case a concurrent request
+        # reloaded the old row in between
+        event.listen(self.db.sync_session, "after_commit", evict, once=True)
@@ -0,0 +1,167 @@
+import hmac
+import json
+import logging
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import stripe
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds a Stripe-Signature timestamp may lag behind, against replayed deliveries
+STRIPE_SIGNATURE_TOLERANCE = 300
+
+WEBHOOK_PROVIDERS = ("stripe", "xendit")
+
+# Checkout metadata key carrying the merchant's user_id; set when the checkout is created
+OWNER_METADATA_KEY = "user_id"
+
+_STRIPE_EVENT_STATUSES = {
+    "checkout.session.async_payment_succeeded": "success",
+    "checkout.session.async_payment_failed": "failed",
+    "checkout.session.expired": "expired",
+}
+_XENDIT_INVOICE_STATUSES = {"PENDING": "pending", "PAID": "success", "SETTLED": "success", "EXPIRED": "expired"}
+_XENDIT_PAYMENT_STATUSES = {
+    "PENDING": "pending",
+    "REQUIRES_ACTION": "pending",
+    "SUCCEEDED": "success",
+    "FAILED": "failed",
+    "VOIDED": "failed",
+    "CANCELED": "failed",
+}
+
+
+class WebhookVerificationError(ValueError):
+    """The delivery is not authentic (bad or missing signature/token) or not parseable"""
+
+
+def verify_webhook(
+    provider: str, body: bytes, headers: Mapping[str, str], secret: Optional[str] = None
+) -> Dict[str, Any]:
+    """Authenticate a webhook delivery and return its decoded JSON payload
+
+    Stripe deliveries are checked by Stripe-Signature HMAC, Xendit ones by
+    x-callback-token. ``secret`` is a merchant's payment_settings.webhook_secret;
+    without it the platform STRIPE_WEBHOOK_SECRET / XENDIT_CALLBACK_TOKEN is used.
+    Raises WebhookVerificationError, including when the secret is not configured.
+    """
+    if provider == "stripe":
+        secret = secret or settings.stripe_webhook_secret
+        if not secret:
+            raise WebhookVerificationError("STRIPE_WEBHOOK_SECRET is not configured")
+        try:
+            stripe.WebhookSignature.verify_header(
+                body.decode("utf-8"), headers.get("stripe-signature", ""), secret, STRIPE_SIGNATURE_TOLERANCE
+            )
+        except (stripe.error.SignatureVerificationError, UnicodeDecodeError) as e:
+            raise WebhookVerificationError(f"Invalid Stripe signature: {str(e)}")
+    elif provider == "xendit":
+        token = secret or settings.xendit_callback_token
+        if not token:
+            raise WebhookVerificationError("XENDIT_CALLBACK_TOKEN is not configured")
+        if not hmac.compare_digest(headers.get("x-callback-token", "").encode(), token.encode()):
+            raise WebhookVerificationError("Invalid Xendit callback token")
+    else:
+        raise WebhookVerificationError(f"Unsupported webhook provider: {provider}")
+
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise WebhookVerificationError(f"Invalid JSON payload: {str(e)}")
+    if not isinstance(payload, dict):
+        raise WebhookVerificationError("Webhook payload must be a JSON object")
+    return payload
+
+
+def describe_event(
+    provider: str, payload: Dict[str, Any], headers: Mapping[str, str]
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return (event_id, event_type, external_id) of a verified payload, for the payment_events row"""
+    if provider == "stripe":
+        session = (payload.get("data") or {}).get("object") or {}
+        return payload.get("id"), payload.get("type"), session.get("client_reference_id") or session.get("id")
+
+    # Xendit: Payment Requests callbacks wrap the object in {"event", "data"}; invoice callbacks are flat
+    if "event" in payload and isinstance(payload.get("data"), dict):
+        data = payload["data"]
+        event_type = payload["event"]
+        external_id = data.get("reference_id")
+    else:
+        data = payload
+        event_type = "invoice"
+        external_id = data.get("external_id")
+    # Invoice callbacks carry no event ID; the object ID plus status identifies one delivery
+    event_id = headers.get("webhook-id") or (f"{data['id']}:{data.get('status')}" if data.get("id") else None)
+    return event_id, event_type, external_id
+
+
+def describe_checkout(provider: str, payload: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Return (checkout_id, owner user_id) of the checkout a verified payload reports on, if any"""
+    if provider == "stripe":
+        if not str(payload.get("type", "")).startswith("checkout.session."):
+            return None, None
+        session = (payload.get("data") or {}).get("object") or {}
+        return session.get("id"), (session.get("metadata") or {}).get(OWNER_METADATA_KEY)
+    if "event" in payload and isinstance(payload.get("data"), dict):
+        # Payment Requests are not hosted checkouts
+        return None, None
+    return payload.get("id"), (payload.get("metadata") or {}).get(OWNER_METADATA_KEY)
+
+
+def _stripe_changes(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    event_type = payload.get("type")
+    session = (payload.get("data") or {}).get("object") or {}
+    if event_type == "checkout.session.completed":
+        status = "success" if session.get("payment_status") in ("paid", "no_payment_required") else "pending"
+    elif event_type in _STRIPE_EVENT_STATUSES:
+        status = _STRIPE_EVENT_STATUSES[event_type]
+    else:
+        return None
+    payment_method_types = session.get("payment_method_types") or []
+    return {
+        "external_id": session.get("client_reference_id") or session.get("id"),
+        "status": status,
+        "amount": (session.get("amount_total") or 0) / 100,
+        "currency": (session.get("currency") or "").upper(),
+        "payment_method": payment_method_types[0] if payment_method_types else "stripe",
+        "user_id": (session.get("metadata") or {}).get(OWNER_METADATA_KEY),
+    }
+
+
+def _xendit_changes(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if "event" in payload and isinstance(payload.get("data"), dict):
+        data = payload["data"]
+        status = _XENDIT_PAYMENT_STATUSES.get(data.get("status"))
+        external_id = data.get("reference_id")
+        payment_method = (data.get("payment_method") or {}).get("type")
+        amount = data.get("amount")
+    else:
+        data = payload
+        status = _XENDIT_INVOICE_STATUSES.get(data.get("status"))
+        external_id = data.get("external_id")
+        payment_method = data.get("payment_channel") or data.get("payment_method")
+        amount = data.get("paid_amount") or data.get("amount")
+    if status is None or not external_id:
+        return None
+    return {
+        "external_id": external_id,
+        "status": status,
+        "amount": float(amount or 0),
+        "currency": (data.get("currency") or "IDR").upper(),
+        "payment_method": payment_method or "xendit",
+        "user_id": (data.get("metadata") or {}).get(OWNER_METADATA_KEY),
+    }
+
+
+def transaction_changes(provider: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map a verified payload onto transactions columns, or None for events that do not affect a payment
+
+    ``user_id`` is the merchant from the checkout metadata and may be None; it is only
+    needed when the transaction does not exist yet.
+    """
+    if provider == "stripe":
+        return _stripe_changes(payload)
+    if provider == "xendit":
+        return _xendit_changes(payload)
+    return None
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Date, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.transaction_daily_rollups import Transaction_daily_rollups
+from models.transactions import Transactions
+
+logger = logging.getLogger(__name__)
+
+# Transaction columns that determine a rollup bucket or its sums
+ROLLUP_SOURCE_FIELDS = ("user_id", "created_at", "currency", "status", "amount")
+
+# Dimensions (and equality filters) that can be answered from the rollup table
+ROLLUP_DIMENSIONS = {
+    "day": Transaction_daily_rollups.day,
+    "currency": Transaction_daily_rollups.currency,
+    "status": Transaction_daily_rollups.status,
+}
+
+
+def created_day(dialect_name: str):
+    """SQL expression for the UTC calendar day of Transactions.created_at, matching rollup_day()"""
+    if dialect_name == "postgresql":
+        return func.date(func.timezone("UTC", Transactions.created_at), type_=Date)
+    return func.date(Transactions.created_at, type_=Date)
+
+
+def rollup_day(created_at: datetime) -> date:
+    """Bucket a timestamp by UTC calendar day"""
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return created_at.date()
+
+
+# ------------------ Service Layer ------------------
+class TransactionRollupsService:
+    """Maintains transaction_daily_rollups, keyed by (user_id, day, currency, status)
+
+    Writers call ``track`` for every transaction row they add (sign=1) or remove (sign=-1)
+    and ``apply`` before committing, so rollups change in the same transaction as the
+    fact table. Transactions without ``created_at`` are not rolled up.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._deltas: Dict[Tuple[str, date, str, str], List[float]] = {}
+
+    def track(self, row: Any, sign: int = 1) -> None:
+        """Record a +/- contribution of a transaction row (ORM object or result row)"""
+        if row.created_at is None:
+            return
+        key = (row.user_id, rollup_day(row.created_at), row.currency, row.status)
+        delta = self._deltas.setdefault(key, [0, 0.0])
+        delta[0] += sign
+        delta[1] += sign * (row.amount or 0)
+
+    async def apply(self) -> None:
+        """Upsert pending deltas into the rollup table (does not commit)"""
+        deltas, self._deltas = self._deltas, {}
+        # Sorted keys give concurrent writers a consistent lock order
+        rows = [
+            {
+                "user_id": user_id,
+                "day": day,
+                "currency": currency,
+                "status": status,
+                "transaction_count": count,
+                "total_amount": amount,
+            }
+            for (user_id, day, currency, status), (count, amount) in sorted(deltas.items())
+            if count or amount
+        ]
+        if not rows:
+            return
+
+        table = Transaction_daily_rollups.__table__
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            stmt = mysql_insert(table)
+            stmt = stmt.on_duplicate_key_update(
+                transaction_count=table.c.transaction_count + stmt.inserted.transaction_count,
+                total_amount=table.c.total_amount + stmt.inserted.total_amount,
+                updated_at=func.now(),
+            )
+        else:
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+            stmt = dialect_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "day", "currency", "status"],
+                set_={
+                    "transaction_count": table.c.transaction_count + stmt.excluded.transaction_count,
+                    "total_amount": table.c.total_amount + stmt.excluded.total_amount,
+                    "updated_at": func.now(),
+                },
+            )
+        await self.db.execute(stmt, rows)
+        logger.debug(f"Applied {len(rows)} transaction rollup deltas")
+
+    async def rebuild(self, user_id: Optional[str] = None) -> int:
+        """Recompute rollups from the transactions table in one transaction; returns bucket count"""
+        try:
+            day = created_day(self.db.get_bind().dialect.name)
+            clear = delete(Transaction_daily_rollups)
+            source = (
+                select(
+                    Transactions.user_id,
+                    day,
+                    Transactions.currency,
+                    Transactions.status,
+                    func.count(Transactions.id),
+                    func.coalesce(func.sum(Transactions.amount), 0),
+                )
+                .where(Transactions.created_at.is_not(None))
+                .group_by(Transactions.user_id, day, Transactions.currency, Transactions.status)
+            )
+            if user_id:
+                clear = clear.where(Transaction_daily_rollups.user_id == user_id)
+                source = source.where(Transactions.user_id == user_id)
+
+            await self.db.execute(clear)
+            result = await self.db.execute(
+                insert(Transaction_daily_rollups).from_select(
+                    ["user_id", "day", "currency", "status", "transaction_count", "total_amount"], source
+                )
+            )
+            await self.db.commit()
+            logger.info(f"Rebuilt {result.rowcount} transaction rollup buckets")
+            return result.rowcount
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error rebuilding transaction rollups: {str(e)}")
+            raise
+
+    async def aggregate(
+        self,
+        group_by: List[str],
+        user_id: Optional[str] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Aggregate pre-computed buckets; same result shape as TransactionsService.aggregate"""
+        dimensions = [ROLLUP_DIMENSIONS[dimension] for dimension in group_by]
+        query = select(
+            *[column.label(dimension) for dimension, column in zip(group_by, dimensions)],
+            func.coalesce(func.sum(Transaction_daily_rollups.transaction_count), 0).label("count"),
+            func.coalesce(func.sum(Transaction_daily_rollups.total_amount), 0).label("total_amount"),
+        )
+        if user_id:
+            query = query.where(Transaction_daily_rollups.user_id == user_id)
+        if start:
+            query = query.where(Transaction_daily_rollups.day >= start)
+        if end:
+            query = query.where(Transaction_daily_rollups.day < end)
+        for field, value in (filters or {}).items():
+            query = query.where(ROLLUP_DIMENSIONS[field] == value)
+        if dimensions:
+            # Buckets emptied by deletes linger with zero counts until the next rebuild
+            query = (
+                query.group_by(*dimensions)
+                .having(func.sum(Transaction_daily_rollups.transaction_count) > 0)
+                .order_by(*dimensions)
+            )
+
+        result = await self.db.execute(query)
+        return [dict(row._mapping) for row in result]
+
+
+async def rebuild_transaction_rollups(user_id: Optional[str] = None) -> int:
+    """Rebuild rollups using the application database settings"""
+    from core.database import db_manager
+
+    await db_manager.init_db()
+    try:
+        async with db_manager.async_session_maker() as db:
+            return await TransactionRollupsService(db).rebuild(user_id=user_id)
+    finally:
+        await db_manager.close_db()
+
+
+if __name__ == "__main__":
+    # python -m services.transaction_rollups [user_id]
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    count = asyncio.run(rebuild_transaction_rollups(sys.argv[1] if len(sys.argv) > 1 else None))
+    print(f"Rebuilt {count} rollup buckets")
@@ -1,172 +1,150 @@
 import logging
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 
-from sqlalchemy import select, func
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.transactions import Transactions
+from services.base import EntityService
+from services.transaction_rollups import (
+    ROLLUP_DIMENSIONS,
+    ROLLUP_SOURCE_FIELDS,
+    TransactionRollupsService,
+    created_day,
+)
+from utils.query_filters import compile_filter
 
 logger = logging.getLogger(__name__)
 
+# Dimensions accepted by TransactionsService.aggregate; "day" buckets created_at by UTC calendar date,
+# built per dialect by created_day() so scans and rollups agree
+AGGREGATE_DIMENSIONS = {
+    "status": Transactions.status,
+    "currency": Transactions.currency,
+    "payment_method": Transactions.payment_method,
+    "day": None,
+}
 
-# ------------------ Service Layer ------------------
-class TransactionsService:
-    """Service layer for Transactions operations"""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a start/end bound to aware UTC; naive values are taken as UTC"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
-    async def create(self, data: Dict[str, Any], user_id: Optional[str] = None) -> Optional[Transactions]:
-        """Create a new transactions"""
-        try:
-            if user_id:
-                data['user_id'] = user_id
-            obj = Transactions(**data)
-            self.db.add(obj)
-            await self.db.commit()
-            await self.db.refresh(obj)
-            logger.info(f"Created transactions with id: {obj.id}")
-            return obj
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Error creating transactions: {str(e)}")
-            raise
 
-    async def check_ownership(self, obj_id: int, user_id: str) -> bool:
-        """Check if user owns this record"""
-        try:
-            obj = await self.get_by_id(obj_id, user_id=user_id)
-            return obj is not None
-        except Exception as e:
-            logger.error(f"Error checking ownership for transactions {obj_id}: {str(e)}")
-            return False
+# ------------------ Service Layer ------------------
+class TransactionsService(EntityService[Transactions]):
+    """Service layer for Transactions operations
 
-    async def get_by_id(self, obj_id: int, user_id: Optional[str] = None) -> Optional[Transactions]:
-        """Get transactions by ID (user can only see their own records)"""
-        try:
-            query = select(Transactions).where(Transactions.id == obj_id)
-            if user_id:
-                query = query.where(Transactions.user_id == user_id)
-            result = await self.db.execute(query)
-            return result.scalar_one_or_none()
-        except Exception as e:
-            logger.error(f"Error fetching transactions {obj_id}: {str(e)}")
-            raise
+    Every write keeps transaction_daily_rollups in step within the same transaction.
+    """
+
+    model = Transactions
+    tracked_fields = ROLLUP_SOURCE_FIELDS
 
-    async def get_list(
-        self, 
-        skip: int = 0, 
-        limit: int = 20, 
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.rollups = TransactionRollupsService(db)
+
+    def _prepare_row(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Rollups bucket by day, so every new transaction gets a timestamp
+        if not data.get('created_at'):
+            data['created_at'] = datetime.now(timezone.utc)
+        return data
+
+    def _track_row(self, row: Any, sign: int = 1) -> None:
+        self.rollups.track(row, sign=sign)
+
+    async def _apply_tracked(self) -> None:
+        await self.rollups.apply()
+
+    @staticmethod
+    def _rollups_can_answer(
+        group_by: List[str], start: Optional[datetime], end: Optional[datetime], query_dict: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Rollups hold whole UTC days keyed by day/currency/status, so only such queries qualify
+
+        ``start`` and ``end`` must already be UTC (see ``_as_utc``).
+        """
+        def on_day_boundary(value: Optional[datetime]) -> bool:
+            if value is None:
+                return True
+            return value.hour == value.minute == value.second == value.microsecond == 0
+
+        return (
+            all(dimension in ROLLUP_DIMENSIONS for dimension in group_by)
+            and all(
+                field in ROLLUP_DIMENSIONS and field != "day" and not isinstance(value, (dict, list))
+                for field, value in (query_dict or {}).items()
+            )
+            and on_day_boundary(start)
+            and on_day_boundary(end)
+        )
+
+    async def _has_undated_rows(self, user_id: Optional[str]) -> bool:
+        """Whether any transaction (of ``user_id``) lacks created_at and is therefore missing from rollups"""
+        conditions = self._owned([Transactions.created_at.is_(None)], user_id)
+        return bool((await self.db.execute(select(exists().where(*conditions)))).scalar())
+
+    async def aggregate(
+        self,
+        group_by: Optional[List[str]] = None,
         user_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
         query_dict: Optional[Dict[str, Any]] = None,
-        sort: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get paginated list of transactionss (user can only see their own records)"""
+    ) -> List[Dict[str, Any]]:
+        """Compute COUNT and SUM(amount) of transactionss in SQL, grouped by the requested dimensions
+
+        ``start`` is inclusive and ``end`` exclusive, both applied to ``created_at``; naive
+        values are UTC. Without ``group_by`` a single overall row is returned. Queries that
+        only touch day/currency/status on whole UTC-day ranges are served from
+        transaction_daily_rollups, unless the range is open and the user has transactions
+        without ``created_at``, which only a scan counts.
+        """
         try:
-            query = select(Transactions)
-            count_query = select(func.count(Transactions.id))
-            
+            group_by = list(dict.fromkeys(group_by or []))
+            unknown = [dimension for dimension in group_by if dimension not in AGGREGATE_DIMENSIONS]
+            if unknown:
+                raise ValueError(f"Unsupported group_by dimension(s): {', '.join(unknown)}")
+            start, end = _as_utc(start), _as_utc(end)
+
+            if self._rollups_can_answer(group_by, start, end, query_dict) and not (
+                start is None and end is None and await self._has_undated_rows(user_id)
+            ):
+                return await self.rollups.aggregate(
+                    group_by,
+                    user_id=user_id,
+                    start=start.date() if start else None,
+                    end=end.date() if end else None,
+                    filters=query_dict,
+                )
+
+            day = created_day(self.db.get_bind().dialect.name)
+            dimensions = [day if dimension == "day" else AGGREGATE_DIMENSIONS[dimension] for dimension in group_by]
+            query = select(
+                *[expr.label(dimension) for dimension, expr in zip(group_by, dimensions)],
+                func.count(Transactions.id).label("count"),
+                func.coalesce(func.sum(Transactions.amount), 0).label("total_amount"),
+            )
             if user_id:
                 query = query.where(Transactions.user_id == user_id)
-                count_query = count_query.where(Transactions.user_id == user_id)
-            
-            if query_dict:
-                for field, value in query_dict.items():
-                    if hasattr(Transactions, field):
-                        query = query.where(getattr(Transactions, field) == value)
-                        count_query = count_query.where(getattr(Transactions, field) == value)
-            
-            count_result = await self.db.execute(count_query)
-            total = count_result.scalar()
-
-            if sort:
-                if sort.startswith('-'):
-                    field_name = sort[1:]
-                    if hasattr(Transactions, field_name):
-                        query = query.order_by(getattr(Transactions, field_name).desc())
-                else:
-                    if hasattr(Transactions, sort):
-                        query = query.order_by(getattr(Transactions, sort))
-            else:
-                query = query.order_by(Transactions.id.desc())
-
-            result = await self.db.execute(query.offset(skip).limit(limit))
-            items = result.scalars().all()
-
-            return {
-                "items": items,
-                "total": total,
-                "skip": skip,
-                "limit": limit,
-            }
-        except Exception as e:
-            logger.error(f"Error fetching transactions list: {str(e)}")
-            raise
-
-    async def update(self, obj_id: int, update_data: Dict[str, Any], user_id: Optional[str] = None) -> Optional[Transactions]:
-        """Update transactions (requires ownership)"""
-        try:
-            obj = await self.get_by_id(obj_id, user_id=user_id)
-            if not obj:
-                logger.warning(f"Transactions {obj_id} not found for update")
-                return None
-            for key, value in update_data.items():
-                if hasattr(obj, key) and key != 'user_id':
-                    setattr(obj, key, value)
-
-            await self.db.commit()
-            await self.db.refresh(obj)
-            logger.info(f"Updated transactions {obj_id}")
-            return obj
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Error updating transactions {obj_id}: {str(e)}")
-            raise
-
-    async def delete(self, obj_id: int, user_id: Optional[str] = None) -> bool:
-        """Delete transactions (requires ownership)"""
-        try:
-            obj = await self.get_by_id(obj_id, user_id=user_id)
-            if not obj:
-                logger.warning(f"Transactions {obj_id} not found for deletion")
-                return False
-            await self.db.delete(obj)
-            await self.db.commit()
-            logger.info(f"Deleted transactions {obj_id}")
-            return True
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Error deleting transactions {obj_id}: {str(e)}")
-            raise
+            if start:
+                query = query.where(Transactions.created_at >= start)
+            if end:
+                query = query.where(Transactions.created_at < end)
+            filter_clause = compile_filter(Transactions, query_dict)
+            if filter_clause is not None:
+                query = query.where(filter_clause)
+            if dimensions:
+                query = query.group_by(*dimensions).order_by(*dimensions)
 
-    async def get_by_field(self, field_name: str, field_value: Any) -> Optional[Transactions]:
-        """Get transactions by any field"""
-        try:
-            if not hasattr(Transactions, field_name):
-                raise ValueError(f"Field {field_name} does not exist on Transactions")
-            result = await self.db.execute(
-                select(Transactions).where(getattr(Transactions, field_name) == field_value)
-            )
-            return result.scalar_one_or_none()
+            result = await self.db.execute(query)
+            return [dict(row._mapping) for row in result]
         except Exception as e:
-            logger.error(f"Error fetching transactions by {field_name}: {str(e)}")
+            logger.error(f"Error aggregating transactions: {str(e)}")
             raise
-
-    async def list_by_field(
-        self, field_name: str, field_value: Any, skip: int = 0, limit: int = 20
-    ) -> List[Transactions]:
-        """Get list of transactionss filtered by field"""
-        try:
-            if not hasattr(Transactions, field_name):
-                raise ValueError(f"Field {field_name} does not exist on Transactions")
-            result = await self.db.execute(
-                select(Transactions)
-                .where(getattr(Transactions, field_name) == field_value)
-                .offset(skip)
-                .limit(limit)
-                .order_by(Transactions.id.desc())
-            )
-            return result.scalars().all()
-        except Exception as e:
-            logger.error(f"Error fetching transactionss by {field_name}: {str(e)}")
-            raise
\ No newline at end of file
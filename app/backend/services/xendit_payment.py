@@ -0,0 +1,221 @@
+import logging
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from core.config import settings
+from core.http_client import get_http_client
+from pydantic import BaseModel, Field, field_validator
+from services.payment import CheckoutError
+
+logger = logging.getLogger(__name__)
+
+# Payment Requests API version the request/response models below follow
+PAYMENT_REQUESTS_API_VERSION = "2022-07-31"
+
+
+class XenditInvoiceRequest(BaseModel):
+    """Request model for creating a Xendit invoice."""
+
+    external_id: str = Field(..., description="Merchant reference for the invoice; echoed back in callbacks")
+    amount: Decimal = Field(..., description="The amount to charge in the specified currency")
+    currency: str = Field("IDR", description="The currency code")
+    description: Optional[str] = Field(None, description="Description shown on the invoice page")
+    payer_email: Optional[str] = Field(None, description="Email the invoice is sent to")
+    success_redirect_url: Optional[str] = Field(None, description="URL to redirect to after payment")
+    failure_redirect_url: Optional[str] = Field(None, description="URL to redirect to if payment fails")
+    invoice_duration: Optional[int] = Field(None, description="Seconds until the invoice expires")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata to store with the invoice")
+
+    @field_validator("amount")
+    @classmethod
+    def validate_amount(cls, v):
+        if v <= 0:
+            raise ValueError("Amount must be greater than 0")
+        return v
+
+
+class XenditInvoiceResponse(BaseModel):
+    """Response model for a Xendit invoice."""
+
+    id: str = Field(..., description="The ID of the invoice")
+    external_id: str = Field(..., description="Merchant reference for the invoice")
+    status: str = Field(..., description="PENDING, PAID, SETTLED or EXPIRED")
+    amount: Decimal = Field(..., description="The invoice amount")
+    currency: str = Field(..., description="The currency code")
+    invoice_url: Optional[str] = Field(None, description="Hosted invoice page to send the payer to")
+    expiry_date: Optional[str] = Field(None, description="When the invoice expires (ISO 8601)")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="The metadata of the invoice")
+
+
+class XenditPaymentRequestRequest(BaseModel):
+    """Request model for creating a Xendit payment request."""
+
+    reference_id: str = Field(..., description="Merchant reference for the payment request")
+    amount: Decimal = Field(..., description="The amount to charge in the specified currency")
+    currency: str = Field("IDR", description="The currency code")
+    payment_method: Dict[str, Any] = Field(
+        ..., description="Payment method object, e.g. {'type': 'EWALLET', 'reusability': 'ONE_TIME_USE', ...}"
+    )
+    customer_id: Optional[str] = Field(None, description="Xendit customer ID")
+    description: Optional[str] = Field(None, description="Description of the payment")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata to store with the request")
+    idempotency_key: Optional[str] = Field(None, description="Idempotency key to avoid duplicate requests")
+
+    @field_validator("amount")
+    @classmethod
+    def validate_amount(cls, v):
+        if v <= 0:
+            raise ValueError("Amount must be greater than 0")
+        return v
+
+
+class XenditPaymentRequestResponse(BaseModel):
+    """Response model for a Xendit payment request."""
+
+    id: str = Field(..., description="The ID of the payment request")
+    reference_id: str = Field(..., description="Merchant reference for the payment request")
+    status: str = Field(..., description="PENDING, REQUIRES_ACTION, SUCCEEDED, FAILED, VOIDED or CANCELED")
+    amount: Decimal = Field(..., description="The requested amount")
+    currency: str = Field(..., description="The currency code")
+    actions: List[Dict[str, Any]] = Field(default_factory=list, description="Next actions, e.g. redirect URLs")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="The metadata of the payment request")
+
+
+def _classify_xendit_error(status_code: int, error_code: str) -> Tuple[str, bool, bool, Optional[str]]:
+    """Classify a Xendit API error and return error type, retryable, fixable, and fix suggestion.
+
+    Returns:
+        Tuple of (error_type, is_retryable, fixable, fix_suggestion)
+    """
+    if status_code == 401 or error_code == "INVALID_API_KEY":
+        return "authentication", False, True, "Check and update XENDIT_API_KEY in environment variables or settings"
+    if status_code == 403:
+        return "authentication", False, True, "Enable the required permission for this API key in the Xendit dashboard"
+    if status_code == 429 or error_code == "RATE_LIMIT_EXCEEDED":
+        return "rate_limit", True, False, "Wait and retry after rate limit resets"
+    if error_code in ("DUPLICATE_ERROR", "IDEMPOTENCY_ERROR") or status_code == 409:
+        return (
+            "idempotency",
+            False,
+            True,
+            "Use a different external_id/idempotency_key or wait for the previous request to complete",
+        )
+    if status_code == 404:
+        return "not_found", False, True, "Verify the invoice or payment request ID"
+    if 400 <= status_code < 500:
+        return "validation", False, True, "Review request parameters and fix invalid values (e.g., amount or currency)"
+    return "api_error", status_code >= 500, False, "Check Xendit API status and retry if it's a temporary server error"
+
+
+class XenditPaymentService:
+    """Payment service class, handles Xendit integration
+
+    Calls go through the shared pooled HTTP client (core.http_client) unless a
+    ``client`` is given; ``api_key`` and ``base_url`` default to settings.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.api_key = api_key if api_key is not None else getattr(settings, "xendit_api_key", "")
+        self.base_url = (base_url or settings.xendit_api_url).rstrip("/")
+        self._client = client
+
+    async def _request(
+        self, method: str, path: str, json: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        if not self.api_key:
+            raise CheckoutError(
+                "Xendit API key is not configured",
+                error_type="authentication",
+                fixable=True,
+                fix_suggestion="Set XENDIT_API_KEY in environment variables or settings",
+            )
+
+        client = self._client or get_http_client()
+        try:
+            response = await client.request(
+                method, f"{self.base_url}{path}", json=json, headers=headers, auth=(self.api_key, "")
+            )
+        except httpx.HTTPError as e:
+            raise CheckoutError(
+                f"Xendit API connection failed for {method} {path}: {str(e)}",
+                error_type="network",
+                is_retryable=True,
+                fixable=False,
+                fix_suggestion="Check network connectivity and Xendit API status",
+                original_error=e,
+            )
+
+        if response.is_success:
+            return response.json()
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        error_code = body.get("error_code", "")
+        error_type, is_retryable, fixable, fix_suggestion = _classify_xendit_error(response.status_code, error_code)
+        message = f"Xendit API error for {method} {path}: {response.status_code} {error_code} {body.get('message', '')}"
+        raise CheckoutError(
+            message.strip(),
+            error_type=error_type,
+            is_retryable=is_retryable,
+            fixable=fixable,
+            fix_suggestion=fix_suggestion,
+        )
+
+    async def create_invoice(self, request: XenditInvoiceRequest) -> XenditInvoiceResponse:
+        """
+        Creates a Xendit invoice (hosted payment page).
+
+        Raises:
+            CheckoutError: If there's an error creating the invoice.
+        """
+        logger.info(f"create xendit invoice with external_id: {request.external_id}")
+        payload = request.model_dump(exclude_none=True)
+        payload["amount"] = float(request.amount)
+        data = await self._request("POST", "/v2/invoices", json=payload)
+        return XenditInvoiceResponse.model_validate(data)
+
+    async def get_invoice(self, invoice_id: str) -> XenditInvoiceResponse:
+        """
+        Retrieves a Xendit invoice, including its current status.
+
+        Raises:
+            CheckoutError: If there's an error retrieving the invoice.
+        """
+        data = await self._request("GET", f"/v2/invoices/{invoice_id}")
+        return XenditInvoiceResponse.model_validate(data)
+
+    async def create_payment_request(self, request: XenditPaymentRequestRequest) -> XenditPaymentRequestResponse:
+        """
+        Creates a Xendit payment request for a specific payment method.
+
+        Raises:
+            CheckoutError: If there's an error creating the payment request.
+        """
+        logger.info(f"create xendit payment request with reference_id: {request.reference_id}")
+        payload = request.model_dump(exclude_none=True, exclude={"idempotency_key"})
+        payload["amount"] = float(request.amount)
+        headers = {"api-version": PAYMENT_REQUESTS_API_VERSION}
+        if request.idempotency_key:
+            headers["idempotency-key"] = request.idempotency_key
+        data = await self._request("POST", "/payment_requests", json=payload, headers=headers)
+        return XenditPaymentRequestResponse.model_validate(data)
+
+    async def get_payment_request(self, payment_request_id: str) -> XenditPaymentRequestResponse:
+        """
+        Retrieves a Xendit payment request, including its current status.
+
+        Raises:
+            CheckoutError: If there's an error retrieving the payment request.
+        """
+        data = await self._request(
+            "GET", f"/payment_requests/{payment_request_id}", headers={"api-version": PAYMENT_REQUESTS_API_VERSION}
+        )
+        return XenditPaymentRequestResponse.model_validate(data)
@@ -0,0 +1,67 @@
+import json
+import logging
+from typing import Optional
+
+from sqlalchemy import literal, select, text
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+# Accepted values of the ``count`` list parameter
+COUNT_MODES = ("exact", "estimate", "none")
+
+
+async def _estimate_postgres(db: AsyncSession, count_query: Select) -> Optional[int]:
+    froms = count_query.get_final_froms()
+    where = count_query.whereclause
+
+    if where is None and len(froms) == 1:
+        # Unfiltered: planner statistics are a single catalog lookup
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": froms[0].name},
+        )
+        reltuples = result.scalar()
+        # -1 means the table has never been vacuumed/analyzed; let EXPLAIN extrapolate instead
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    # EXPLAIN the row source rather than the aggregate, whose plan rows are always 1
+    rows_query = select(literal(1)).select_from(*froms)
+    if where is not None:
+        rows_query = rows_query.where(where)
+    try:
+        sql = str(rows_query.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+    except (CompileError, NotImplementedError) as e:
+        logger.debug(f"Cannot render count estimate query, using exact count: {str(e)}")
+        return None
+    # Sent as-is: text() would read ":name" inside rendered filter values as bind parameters
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(db: AsyncSession, count_query: Select, mode: str = "exact") -> Optional[int]:
+    """Resolve the ``total`` of a list response according to ``mode``
+
+    ``count_query`` is a ``SELECT count(...) ... WHERE ...`` over the filtered set.
+    ``exact`` runs it; ``none`` skips it and returns None; ``estimate`` uses planner
+    statistics instead (``pg_class.reltuples`` when unfiltered, otherwise the row
+    estimate from ``EXPLAIN``). Other dialects have no usable estimate and fall back
+    to the exact count. Raises ValueError for unknown modes.
+    """
+    if mode not in COUNT_MODES:
+        raise ValueError(f"Invalid count mode {mode}; expected one of {', '.join(COUNT_MODES)}")
+    if mode == "none":
+        return None
+    if mode == "estimate" and db.get_bind().dialect.name == "postgresql":
+        estimate = await _estimate_postgres(db, count_query)
+        if estimate is not None:
+            return estimate
+    result = await db.execute(count_query)
+    return result.scalar()
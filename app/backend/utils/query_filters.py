@@ -0,0 +1,115 @@
+import json
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import Date, DateTime, and_
+from sqlalchemy.sql.elements import ColumnElement
+
+FILTER_CACHE_SIZE = 512
+
+# Operator -> clause builder; operands are validated in _build_condition
+_OPERATORS: Dict[str, Callable[[Any, Any], ColumnElement]] = {
+    "$eq": lambda column, value: column == value,
+    "$ne": lambda column, value: column != value,
+    "$gt": lambda column, value: column > value,
+    "$gte": lambda column, value: column >= value,
+    "$lt": lambda column, value: column < value,
+    "$lte": lambda column, value: column <= value,
+    "$in": lambda column, value: column.in_(value),
+    "$nin": lambda column, value: column.not_in(value),
+    "$between": lambda column, value: column.between(value[0], value[1]),
+    "$like": lambda column, value: column.like(value),
+    "$ilike": lambda column, value: column.ilike(value),
+    "$isnull": lambda column, value: column.is_(None) if value else column.is_not(None),
+}
+
+
+def _coerce(column, value: Any) -> Any:
+    """Convert JSON scalars to the Python type the column's driver expects (e.g. ISO strings to datetime)"""
+    if isinstance(value, list):
+        return [_coerce(column, item) for item in value]
+    if not isinstance(value, str):
+        return value
+    try:
+        if isinstance(column.type, DateTime):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if isinstance(column.type, Date):
+            return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid date value for field {column.name}: {value}")
+    return value
+
+
+def _build_condition(column, operator: str, value: Any) -> ColumnElement:
+    if operator not in _OPERATORS:
+        raise ValueError(f"Unsupported query operator {operator} for field {column.name}")
+    if operator in ("$in", "$nin") and not isinstance(value, list):
+        raise ValueError(f"{operator} on field {column.name} expects a list")
+    if operator == "$between" and (not isinstance(value, list) or len(value) != 2):
+        raise ValueError(f"$between on field {column.name} expects a [low, high] list")
+    if operator == "$isnull" and not isinstance(value, bool):
+        raise ValueError(f"$isnull on field {column.name} expects true or false")
+    if operator in ("$like", "$ilike") and not isinstance(value, str):
+        raise ValueError(f"{operator} on field {column.name} expects a string pattern")
+    return _OPERATORS[operator](column, _coerce(column, value))
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _compile_cached(table, normalized: str) -> Optional[ColumnElement]:
+    conditions = []
+    for field, spec in json.loads(normalized).items():
+        # Unknown fields are ignored, matching the original equality-only behaviour
+        if field not in table.columns:
+            continue
+        column = table.columns[field]
+        if isinstance(spec, dict):
+            if not spec:
+                continue
+            conditions.extend(_build_condition(column, operator, value) for operator, value in spec.items())
+        else:
+            conditions.append(column == _coerce(column, spec))
+    if not conditions:
+        return None
+    return and_(*conditions)
+
+
+def compile_filter(model, query_dict: Optional[Dict[str, Any]]) -> Optional[ColumnElement]:
+    """Compile a ``query`` JSON object into a single SQLAlchemy clause for ``model``
+
+    Plain values mean equality; objects map operators to operands, e.g.
+    ``{"amount": {"$gt": 10}, "status": {"$in": ["success", "pending"]},
+    "created_at": {"$between": ["2026-01-01", "2026-02-01"]}, "description": {"$like": "%inv%"},
+    "external_id": {"$isnull": false}}``. Supported operators: $eq, $ne, $gt, $gte, $lt, $lte,
+    $in, $nin, $between, $like, $ilike, $isnull.
+
+    Compiled clauses are cached by the normalized (key-sorted) JSON so repeated filters skip
+    parsing and validation. Returns None when nothing applies; raises ValueError on bad input.
+    """
+    if not query_dict:
+        return None
+    if not isinstance(query_dict, dict):
+        raise ValueError("Query must be a JSON object")
+    normalized = json.dumps(query_dict, sort_keys=True, separators=(",", ":"), default=str)
+    return _compile_cached(model.__table__, normalized)
+
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _projection_cached(table, fields: Tuple[str, ...]) -> List:
+    names = ["id"] + [field for field in fields if field != "id" and field in table.columns]
+    return [table.columns[name] for name in names]
+
+
+def build_projection(model, fields: Optional[List[str]]) -> Optional[List]:
+    """Resolve requested field names to ``model`` columns for a column-only select
+
+    ``id`` is always included and unknown names are ignored. Returns None when no
+    projection was requested, meaning full ORM objects should be loaded.
+    """
+    if not fields:
+        return None
+    requested = tuple(dict.fromkeys(field.strip() for field in fields if field and field.strip()))
+    if not requested:
+        return None
+    return _projection_cached(model.__table__, requested)
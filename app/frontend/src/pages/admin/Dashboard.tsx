@@ -43,32 +43,34 @@ export default function AdminDashboard() {
 
   const loadDashboardData = async () => {
     try {
-      // Load transactions
-      const transactionsRes = await client.entities.transactions.query({
-        query: {},
-        limit: 1000,
+      // Transaction totals are aggregated server-side, one row per status
+      const statsRes = await client.apiCall.invoke({
+        url: '/api/v1/entities/transactions/stats',
+        method: 'GET',
+        data: { group_by: 'status' },
       });
-      const transactions = transactionsRes.data?.items || [];
-      const totalRevenue = transactions
-        .filter((t: { status: string }) => t.status === 'success')
-        .reduce((sum: number, t: { amount: number }) => sum + (t.amount || 0), 0);
+      const groups: { status: string; count: number; total_amount: number }[] = statsRes.data?.groups || [];
+      const totalTransactions = statsRes.data?.total_count || 0;
+      const totalRevenue = groups
+        .filter((g) => g.status === 'success')
+        .reduce((sum, g) => sum + (g.total_amount || 0), 0);
 
-      // Load contact submissions
+      // Only the totals are needed, so fetch a single row per entity
       const contactsRes = await client.entities.contact_submissions.query({
         query: { status: 'pending' },
-        limit: 1000,
+        limit: 1,
       });
-      const pendingMessages = contactsRes.data?.items?.length || 0;
+      const pendingMessages = contactsRes.data?.total || 0;
 
       // Load payment settings
       const paymentRes = await client.entities.payment_settings.query({
         query: { is_active: true },
-        limit: 100,
+        limit: 1,
       });
-      const activePaymentSettings = paymentRes.data?.items?.length || 0;
+      const activePaymentSettings = paymentRes.data?.total || 0;
 
       setStats({
-        totalTransactions: transactions.length,
+        totalTransactions,
         totalRevenue,
         pendingMessages,
         activePaymentSettings,
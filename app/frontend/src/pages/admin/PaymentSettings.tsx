@@ -52,6 +52,7 @@ interface PaymentSetting {
   provider: string;
   public_key: string;
   secret_key: string;
+  has_webhook_secret?: boolean;
   is_active: boolean;
   environment: string;
   created_at: string;
@@ -69,6 +70,7 @@ export default function PaymentSettings() {
     provider: 'xendit',
     public_key: '',
     secret_key: '',
+    webhook_secret: '',
     is_active: true,
     environment: 'sandbox',
   });
@@ -103,12 +105,15 @@ export default function PaymentSettings() {
     setIsSaving(true);
     try {
       const now = new Date().toISOString();
+      // The webhook secret is write-only: a blank field keeps the stored one
+      const { webhook_secret, ...fields } = formData;
+      const data = webhook_secret ? formData : fields;
       
       if (editingId) {
         await client.entities.payment_settings.update({
           id: String(editingId),
           data: {
-            ...formData,
+            ...data,
             updated_at: now,
           },
         });
@@ -116,7 +121,7 @@ export default function PaymentSettings() {
       } else {
         await client.entities.payment_settings.create({
           data: {
-            ...formData,
+            ...data,
             created_at: now,
             updated_at: now,
           },
@@ -130,6 +135,7 @@ export default function PaymentSettings() {
         provider: 'xendit',
         public_key: '',
         secret_key: '',
+        webhook_secret: '',
         is_active: true,
         environment: 'sandbox',
       });
@@ -148,6 +154,7 @@ export default function PaymentSettings() {
       provider: setting.provider,
       public_key: setting.public_key,
       secret_key: setting.secret_key,
+      webhook_secret: '',
       is_active: setting.is_active,
       environment: setting.environment || 'sandbox',
     });
@@ -278,6 +285,7 @@ export default function PaymentSettings() {
                       provider: 'xendit',
                       public_key: '',
                       secret_key: '',
+                      webhook_secret: '',
                       is_active: true,
                       environment: 'sandbox',
                     });
@@ -347,6 +355,27 @@ export default function PaymentSettings() {
                       className="bg-slate-800 border-slate-700 text-white placeholder:text-slate-500"
                     />
                   </div>
+                  <div className="space-y-2">
+                    <Label className="text-slate-300">Webhook Secret (optional)</Label>
+                    <Input
+                      type="password"
+                      placeholder={
+                        settings.find((setting) => setting.id === editingId)?.has_webhook_secret
+                          ? 'Stored - leave blank to keep'
+                          : formData.provider === 'stripe'
+                            ? 'whsec_...'
+                            : 'Callback verification token'
+                      }
+                      value={formData.webhook_secret}
+                      onChange={(e) => setFormData({ ...formData, webhook_secret: e.target.value })}
+                      className="bg-slate-800 border-slate-700 text-white placeholder:text-slate-500"
+                    />
+                    {editingId && (
+                      <p className="text-xs text-slate-500 break-all">
+                        Webhook URL: {window.location.origin}/api/v1/payments/webhooks/{formData.provider}/{editingId}
+                      </p>
+                    )}
+                  </div>
                   <div className="flex items-center justify-between">
                     <Label className="text-slate-300">Active</Label>
                     <Switch